@@ -16,17 +16,28 @@ import asyncio
 import click
 import logging
 
-from src.utils.logger import setup_logging
-
 logger = logging.getLogger(__name__)
 
 
+async def _with_db(engine, method, *args, **kwargs):
+    """Run an engine coroutine with the DB connected for this event loop.
+
+    Each asyncio.run() gets a fresh loop, so the Prisma connection is opened
+    and closed around the call rather than kept between commands.
+    """
+    async with engine:
+        return await method(*args, **kwargs)
+
+
 @click.group()
 @click.option("--config", "-c", default=None, help="Path to config YAML file")
 @click.option("--verbose", "-v", is_flag=True, help="Enable debug logging")
 @click.pass_context
 def cli(ctx, config, verbose):
     """US Local Business Lead Scraper — Bloblok Studio"""
+    # Imported here so `--help` doesn't pull in rich/yaml/dotenv
+    from src.utils.logger import setup_logging
+
     setup_logging()
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -42,7 +53,10 @@ def run(ctx):
 
     engine = ScraperEngine(ctx.obj["config"])
     click.echo("Starting full scraping pipeline...")
-    results = asyncio.run(engine.run())
+    try:
+        results = asyncio.run(_with_db(engine, engine.run))
+    finally:
+        engine.close()
 
     click.echo("\n--- Results ---")
     click.echo(f"  Leads found:    {results['total_found']}")
@@ -66,7 +80,10 @@ def scrape(ctx, source, category, location, pages):
 
     engine = ScraperEngine(ctx.obj["config"])
     click.echo(f"Scraping {source} for '{category}' in {location}...")
-    stats = asyncio.run(engine.scrape_single_source(source, category, location, pages))
+    try:
+        stats = asyncio.run(_with_db(engine, engine.scrape_single_source, source, category, location, pages))
+    finally:
+        engine.close()
 
     click.echo(f"\n  Found: {stats['found']} | New: {stats['new']} | Updated: {stats['updated']}")
     if stats.get("error"):
@@ -82,7 +99,7 @@ def enrich(ctx, limit):
 
     engine = ScraperEngine(ctx.obj["config"])
     click.echo(f"Enriching up to {limit} leads...")
-    results = asyncio.run(engine.enrich_only(limit=limit))
+    results = asyncio.run(_with_db(engine, engine.enrich_only, limit=limit))
 
     click.echo(f"\n  Total: {results['total']} | Success: {results['success']} | Failed: {results['failed']}")
 
@@ -103,11 +120,11 @@ def enrich_leads(ctx, lead_ids):
 
     if len(ids) == 1:
         click.echo(f"Enriching lead {ids[0]}...")
-        result = asyncio.run(engine.enrich_single(ids[0]))
+        result = asyncio.run(_with_db(engine, engine.enrich_single, ids[0]))
         click.echo(f"  {result['businessName']}: quality={result['qualityScore']}, icp={result['icpScore']}")
     else:
         click.echo(f"Enriching {len(ids)} leads...")
-        result = asyncio.run(engine.enrich_multiple(ids))
+        result = asyncio.run(_with_db(engine, engine.enrich_multiple, ids))
         click.echo(f"  Total: {result['total']} | Success: {result['success']} | Failed: {result['failed']}")
 
 
@@ -121,7 +138,7 @@ def re_enrich(ctx, days, limit):
 
     engine = ScraperEngine(ctx.obj["config"])
     click.echo(f"Re-enriching leads older than {days} days (max {limit})...")
-    results = asyncio.run(engine.re_enrich(stale_days=days, limit=limit))
+    results = asyncio.run(_with_db(engine, engine.re_enrich, stale_days=days, limit=limit))
 
     click.echo(f"\n  Stale found: {results['stale_found']} | "
                f"Total: {results['total']} | "
@@ -210,6 +227,20 @@ def init_database(ctx):
         click.echo(f"Error: {result.stderr}")
         raise SystemExit(1)
 
+    # Extensions and indexes the Prisma schema can't declare
+    click.echo("Applying prisma/post_push.sql...")
+    result = subprocess.run(
+        [sys.executable, "-m", "prisma", "db", "execute",
+         "--file", "prisma/post_push.sql", "--schema", "prisma/schema.prisma"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode == 0:
+        click.echo("Database indexes applied.")
+    else:
+        click.echo(f"Error: {result.stderr}")
+        raise SystemExit(1)
+
 
 @cli.command()
 @click.pass_context
@@ -234,7 +265,7 @@ def schedule(ctx):
 
     def job():
         click.echo("Running scheduled scrape...")
-        results = asyncio.run(engine.run())
+        results = asyncio.run(_with_db(engine, engine.run))
         click.echo(f"Scheduled run complete: {results['total_new']} new leads")
 
     sched.every(interval).hours.at(start_time).do(job)
@@ -248,6 +279,8 @@ def schedule(ctx):
             time.sleep(60)
     except KeyboardInterrupt:
         click.echo("\nScheduler stopped.")
+    finally:
+        engine.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+-- Objects Prisma's schema language can't express (extensions, triggers, GIN
+-- and expression indexes). Applied by `python main.py init-db` after `db push`;
+-- every statement is idempotent so it is safe to re-run. `db push` drops
+-- indexes it doesn't know about, so re-apply this after every push.
+
+-- Trigram similarity for fuzzy business-name dedup
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Normalized business name, same rules as repository._normalize_biz_name:
+-- lowercase, drop legal/descriptive suffixes, drop punctuation, squeeze spaces.
+-- Prisma can't declare generated columns, so a trigger keeps it current.
+CREATE OR REPLACE FUNCTION normalize_biz_name(name text) RETURNS text
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT btrim(regexp_replace(
+        regexp_replace(
+            regexp_replace(
+                lower(name),
+                '\m(llc|inc|corp|corporation|co|ltd|lp|llp|pc|pllc|company|group|'
+                'services|service|enterprises|enterprise|associates|holdings|solutions)\M',
+                '', 'g'),
+            '[^[:alnum:]_[:space:]]', '', 'g'),
+        '\s+', ' ', 'g'))
+$$;
+
+CREATE OR REPLACE FUNCTION leads_set_business_name_norm() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.business_name_norm := normalize_biz_name(NEW.business_name);
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS trg_leads_business_name_norm ON leads;
+CREATE TRIGGER trg_leads_business_name_norm
+    BEFORE INSERT OR UPDATE OF business_name ON leads
+    FOR EACH ROW EXECUTE FUNCTION leads_set_business_name_norm();
+
+UPDATE leads SET business_name_norm = normalize_biz_name(business_name)
+WHERE business_name_norm IS NULL;
+
+DROP INDEX IF EXISTS ix_leads_name_trgm;
+CREATE INDEX IF NOT EXISTS ix_leads_name_norm_trgm
+    ON leads USING gin (business_name_norm gin_trgm_ops);
+
+-- Case-insensitive city lookup used alongside the trigram filter
+CREATE INDEX IF NOT EXISTS ix_leads_state_city_lower
+    ON leads (state, lower(city));
+
+-- Enrichment queue: only unenriched rows, in get_unenriched_leads order.
+-- Partial, so it stays small as the enriched backlog grows.
+CREATE INDEX IF NOT EXISTS ix_leads_unenriched_queue
+    ON leads (scraped_at DESC, id DESC) WHERE is_enriched = false;
+
+-- Per-state / per-category lead counts for get_stats. Statement-level
+-- triggers fold each INSERT/UPDATE/DELETE into one upsert per key.
+CREATE OR REPLACE FUNCTION leads_rollup_bump(states text[], categories text[], delta int)
+RETURNS void LANGUAGE sql AS $$
+    INSERT INTO lead_state_counts AS t (state, count)
+    SELECT s, count(*) * delta FROM unnest(states) AS s
+    WHERE s IS NOT NULL GROUP BY s
+    ON CONFLICT (state) DO UPDATE SET count = t.count + EXCLUDED.count;
+
+    INSERT INTO lead_category_counts AS t (category, count)
+    SELECT c, count(*) * delta FROM unnest(categories) AS c
+    WHERE c IS NOT NULL AND c <> '' GROUP BY c
+    ON CONFLICT (category) DO UPDATE SET count = t.count + EXCLUDED.count;
+$$;
+
+CREATE OR REPLACE FUNCTION leads_rollup() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM leads_rollup_bump(
+            ARRAY(SELECT state FROM new_rows), ARRAY(SELECT category FROM new_rows), 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM leads_rollup_bump(
+            ARRAY(SELECT state FROM old_rows), ARRAY(SELECT category FROM old_rows), -1);
+    ELSE
+        -- Only rows whose state/category actually changed move between buckets
+        PERFORM leads_rollup_bump(
+            ARRAY(SELECT o.state FROM old_rows o JOIN new_rows n USING (id)
+                  WHERE o.state IS DISTINCT FROM n.state),
+            ARRAY(SELECT o.category FROM old_rows o JOIN new_rows n USING (id)
+                  WHERE o.category IS DISTINCT FROM n.category),
+            -1);
+        PERFORM leads_rollup_bump(
+            ARRAY(SELECT n.state FROM old_rows o JOIN new_rows n USING (id)
+                  WHERE o.state IS DISTINCT FROM n.state),
+            ARRAY(SELECT n.category FROM old_rows o JOIN new_rows n USING (id)
+                  WHERE o.category IS DISTINCT FROM n.category),
+            1);
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS trg_leads_rollup_insert ON leads;
+CREATE TRIGGER trg_leads_rollup_insert
+    AFTER INSERT ON leads REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION leads_rollup();
+
+DROP TRIGGER IF EXISTS trg_leads_rollup_update ON leads;
+CREATE TRIGGER trg_leads_rollup_update
+    AFTER UPDATE ON leads REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION leads_rollup();
+
+DROP TRIGGER IF EXISTS trg_leads_rollup_delete ON leads;
+CREATE TRIGGER trg_leads_rollup_delete
+    AFTER DELETE ON leads REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION leads_rollup();
+
+-- Rebuild from scratch so re-running this file never double counts
+TRUNCATE lead_state_counts, lead_category_counts;
+INSERT INTO lead_state_counts (state, count)
+    SELECT state, count(*) FROM leads WHERE state IS NOT NULL GROUP BY state;
+INSERT INTO lead_category_counts (category, count)
+    SELECT category, count(*) FROM leads
+    WHERE category IS NOT NULL AND category <> '' GROUP BY category;
@@ -8,6 +8,9 @@ Usage:
     SCRAPER_API_KEY=your-secret python3 server.py
     # or
     SCRAPER_API_KEY=your-secret uvicorn server:app --host 0.0.0.0 --port 8000
+
+Job state lives in process memory unless REDIS_URL is set, in which case it
+is kept in Redis so several workers (or a restarted server) see the same jobs.
 """
 
 from __future__ import annotations
@@ -15,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 import uuid
 from datetime import datetime, timezone
 
@@ -23,6 +27,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from src.engine import ScraperEngine
+from src.job_store import create_job_store
 
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
@@ -41,6 +46,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+@app.on_event("startup")
+async def startup():
+    # One engine for the whole process — config is parsed once and the
+    # Prisma connection is shared by every request instead of per job.
+    app.state.engine = ScraperEngine()
+    await app.state.engine.connect()
+    app.state.jobs = create_job_store(os.getenv("REDIS_URL"))
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.engine.close()
+    await app.state.jobs.close()
+    await app.state.engine.disconnect()
+
+
 # ---------------------------------------------------------------------------
 # Auth
 # ---------------------------------------------------------------------------
@@ -51,29 +76,21 @@ async def verify_api_key(x_api_key: str = Header(default="")):
 
 
 # ---------------------------------------------------------------------------
-# In-memory job tracking
+# Job tracking
 # ---------------------------------------------------------------------------
 
-jobs: dict[str, dict] = {}
+# Finished scrape jobs are dropped 10 min after start
+JOB_TTL_SECONDS = 600
 
-# Enrichment is a singleton — only one at a time
-enrich_state: dict = {"status": "idle", "output": [], "progress": {}}
+# Enrichment and re-enrichment are singletons — only one of each at a time
+ENRICH_JOB_ID = "enrich"
+RE_ENRICH_JOB_ID = "re-enrich"
 
 
 def _new_job_id() -> str:
     return f"job_{uuid.uuid4().hex[:8]}"
 
 
-def _clean_old_jobs():
-    cutoff = datetime.now(timezone.utc).timestamp() - 600  # 10 min
-    to_delete = [
-        jid for jid, j in jobs.items()
-        if j["status"] != "running" and j.get("started_ts", 0) < cutoff
-    ]
-    for jid in to_delete:
-        del jobs[jid]
-
-
 # ---------------------------------------------------------------------------
 # Request / Response models
 # ---------------------------------------------------------------------------
@@ -104,23 +121,23 @@ class ReEnrichRequest(BaseModel):
 
 @app.post("/scrape", dependencies=[Depends(verify_api_key)])
 async def start_scrape(req: ScrapeRequest):
-    _clean_old_jobs()
+    store = app.state.jobs
     job_id = _new_job_id()
+    now = datetime.now(timezone.utc)
 
-    jobs[job_id] = {
+    await store.create(job_id, {
         "status": "running",
-        "output": [],
         "params": req.model_dump(),
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "started_ts": datetime.now(timezone.utc).timestamp(),
+        "started_at": now.isoformat(),
+        "started_ts": now.timestamp(),
         "progress": {},
-    }
+    }, ttl=JOB_TTL_SECONDS)
 
     async def _run():
         try:
-            engine = ScraperEngine()
-            jobs[job_id]["output"].append(
-                f"Scraping {req.source} for '{req.category}' in {req.location}..."
+            engine = app.state.engine
+            await store.append_output(
+                job_id, f"Scraping {req.source} for '{req.category}' in {req.location}..."
             )
             result = await engine.scrape_single_source(
                 source=req.source,
@@ -128,21 +145,25 @@ async def start_scrape(req: ScrapeRequest):
                 location=req.location,
                 max_pages=req.pages,
             )
-            jobs[job_id]["output"].append(
+            await store.append_output(
+                job_id,
                 f"Found: {result.get('found', 0)} | "
                 f"New: {result.get('new', 0)} | "
                 f"Updated: {result.get('updated', 0)}"
             )
-            jobs[job_id]["progress"] = {
-                "leadsFound": result.get("found", 0),
-                "leadsNew": result.get("new", 0),
-                "percent": 100,
-            }
-            jobs[job_id]["status"] = "completed"
+            await store.update(
+                job_id,
+                progress={
+                    "leadsFound": result.get("found", 0),
+                    "leadsNew": result.get("new", 0),
+                    "percent": 100,
+                },
+                status="completed",
+            )
         except Exception as e:
             logger.exception("Scrape failed")
-            jobs[job_id]["output"].append(f"ERROR: {str(e)}")
-            jobs[job_id]["status"] = "failed"
+            await store.append_output(job_id, f"ERROR: {str(e)}")
+            await store.update(job_id, status="failed")
 
     asyncio.create_task(_run())
     return {"jobId": job_id, "status": "running"}
@@ -150,10 +171,10 @@ async def start_scrape(req: ScrapeRequest):
 
 @app.get("/scrape/{job_id}", dependencies=[Depends(verify_api_key)])
 async def get_scrape_status(job_id: str):
-    if job_id not in jobs:
+    j = await app.state.jobs.get(job_id) if job_id.startswith("job_") else None
+    if j is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    j = jobs[job_id]
     return {
         "jobId": job_id,
         "status": j["status"],
@@ -169,13 +190,13 @@ async def list_scrape_jobs():
     return {
         "jobs": [
             {
-                "jobId": jid,
+                "jobId": j["job_id"],
                 "status": j["status"],
                 "params": j["params"],
                 "startedAt": j["started_at"],
-                "outputLines": len(j["output"]),
+                "outputLines": j["output_lines"],
             }
-            for jid, j in jobs.items()
+            for j in await app.state.jobs.list_jobs("job_")
         ]
     }
 
@@ -186,36 +207,41 @@ async def list_scrape_jobs():
 
 @app.post("/enrich", dependencies=[Depends(verify_api_key)])
 async def start_enrich(req: EnrichRequest):
-    if enrich_state["status"] == "running":
+    store = app.state.jobs
+    claimed = await store.claim(ENRICH_JOB_ID, {
+        "status": "running",
+        "progress": {"current": 0, "total": 0, "percent": 0, "lastBusiness": ""},
+        "limit": req.limit,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    })
+    if not claimed:
         raise HTTPException(status_code=409, detail="Enrichment already running")
 
-    enrich_state["status"] = "running"
-    enrich_state["output"] = []
-    enrich_state["progress"] = {"current": 0, "total": 0, "percent": 0, "lastBusiness": ""}
-    enrich_state["limit"] = req.limit
-    enrich_state["started_at"] = datetime.now(timezone.utc).isoformat()
-
     async def _run():
         try:
-            engine = ScraperEngine()
-            enrich_state["output"].append(f"Starting enrichment of up to {req.limit} leads...")
+            engine = app.state.engine
+            await store.append_output(ENRICH_JOB_ID, f"Starting enrichment of up to {req.limit} leads...")
             result = await engine.enrich_only(limit=req.limit)
-            enrich_state["output"].append(
+            await store.append_output(
+                ENRICH_JOB_ID,
                 f"Total: {result.get('total', 0)} | "
                 f"Success: {result.get('success', 0)} | "
                 f"Failed: {result.get('failed', 0)}"
             )
-            enrich_state["progress"] = {
-                "current": result.get("success", 0),
-                "total": result.get("total", 0),
-                "percent": 100,
-                "lastBusiness": "",
-            }
-            enrich_state["status"] = "completed"
+            await store.update(
+                ENRICH_JOB_ID,
+                progress={
+                    "current": result.get("success", 0),
+                    "total": result.get("total", 0),
+                    "percent": 100,
+                    "lastBusiness": "",
+                },
+                status="completed",
+            )
         except Exception as e:
             logger.exception("Enrichment failed")
-            enrich_state["output"].append(f"ERROR: {str(e)}")
-            enrich_state["status"] = "failed"
+            await store.append_output(ENRICH_JOB_ID, f"ERROR: {str(e)}")
+            await store.update(ENRICH_JOB_ID, status="failed")
 
     asyncio.create_task(_run())
     return {"status": "running", "limit": req.limit}
@@ -223,12 +249,13 @@ async def start_enrich(req: EnrichRequest):
 
 @app.get("/enrich", dependencies=[Depends(verify_api_key)])
 async def get_enrich_status():
+    state = await app.state.jobs.get(ENRICH_JOB_ID) or {"status": "idle"}
     return {
-        "status": enrich_state["status"],
-        "output": enrich_state.get("output", []),
-        "limit": enrich_state.get("limit", 0),
-        "progress": enrich_state.get("progress", {}),
-        "startedAt": enrich_state.get("started_at", ""),
+        "status": state["status"],
+        "output": state.get("output", []),
+        "limit": state.get("limit", 0),
+        "progress": state.get("progress", {}),
+        "startedAt": state.get("started_at", ""),
     }
 
 
@@ -244,7 +271,7 @@ async def enrich_specific_leads(req: EnrichLeadsRequest):
 
     async def _run():
         try:
-            engine = ScraperEngine()
+            engine = app.state.engine
             if len(req.lead_ids) == 1:
                 result = await engine.enrich_single(req.lead_ids[0])
             else:
@@ -264,41 +291,44 @@ async def enrich_specific_leads(req: EnrichLeadsRequest):
 # Re-enrich endpoints
 # ---------------------------------------------------------------------------
 
-re_enrich_state: dict = {"status": "idle", "output": [], "progress": {}}
-
-
 @app.post("/re-enrich", dependencies=[Depends(verify_api_key)])
 async def start_re_enrich(req: ReEnrichRequest):
-    if re_enrich_state["status"] == "running":
+    store = app.state.jobs
+    claimed = await store.claim(RE_ENRICH_JOB_ID, {
+        "status": "running",
+        "progress": {"current": 0, "total": 0, "percent": 0},
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    })
+    if not claimed:
         raise HTTPException(status_code=409, detail="Re-enrichment already running")
 
-    re_enrich_state["status"] = "running"
-    re_enrich_state["output"] = []
-    re_enrich_state["progress"] = {"current": 0, "total": 0, "percent": 0}
-    re_enrich_state["started_at"] = datetime.now(timezone.utc).isoformat()
-
     async def _run():
         try:
-            engine = ScraperEngine()
-            re_enrich_state["output"].append(
+            engine = app.state.engine
+            await store.append_output(
+                RE_ENRICH_JOB_ID,
                 f"Re-enriching leads older than {req.days} days (limit: {req.limit})..."
             )
             result = await engine.re_enrich(stale_days=req.days, limit=req.limit)
-            re_enrich_state["output"].append(
+            await store.append_output(
+                RE_ENRICH_JOB_ID,
                 f"Stale found: {result.get('stale_found', 0)} | "
                 f"Success: {result.get('success', 0)} | "
                 f"Failed: {result.get('failed', 0)}"
             )
-            re_enrich_state["progress"] = {
-                "current": result.get("success", 0),
-                "total": result.get("stale_found", 0),
-                "percent": 100,
-            }
-            re_enrich_state["status"] = "completed"
+            await store.update(
+                RE_ENRICH_JOB_ID,
+                progress={
+                    "current": result.get("success", 0),
+                    "total": result.get("stale_found", 0),
+                    "percent": 100,
+                },
+                status="completed",
+            )
         except Exception as e:
             logger.exception("Re-enrichment failed")
-            re_enrich_state["output"].append(f"ERROR: {str(e)}")
-            re_enrich_state["status"] = "failed"
+            await store.append_output(RE_ENRICH_JOB_ID, f"ERROR: {str(e)}")
+            await store.update(RE_ENRICH_JOB_ID, status="failed")
 
     asyncio.create_task(_run())
     return {"status": "running", "days": req.days, "limit": req.limit}
@@ -306,21 +336,44 @@ async def start_re_enrich(req: ReEnrichRequest):
 
 @app.get("/re-enrich", dependencies=[Depends(verify_api_key)])
 async def get_re_enrich_status():
+    state = await app.state.jobs.get(RE_ENRICH_JOB_ID) or {"status": "idle"}
     return {
-        "status": re_enrich_state["status"],
-        "output": re_enrich_state.get("output", []),
-        "progress": re_enrich_state.get("progress", {}),
-        "startedAt": re_enrich_state.get("started_at", ""),
+        "status": state["status"],
+        "output": state.get("output", []),
+        "progress": state.get("progress", {}),
+        "startedAt": state.get("started_at", ""),
     }
 
 
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+@app.get("/stats", dependencies=[Depends(verify_api_key)])
+async def get_stats():
+    from src.database.connection import get_client
+    from src.database.repository import LeadRepository
+
+    db = await get_client()
+    return await LeadRepository(db).get_stats()
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
 
+# (epoch second, ISO string) — probes hitting /health many times a second
+# reuse the formatted timestamp instead of rebuilding it each call
+_health_ts: tuple[int, str] = (0, "")
+
+
 @app.get("/health")
 async def health():
-    return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
+    global _health_ts
+    second = int(time.time())
+    if second != _health_ts[0]:
+        _health_ts = (second, datetime.now(timezone.utc).isoformat())
+    return {"status": "ok", "timestamp": _health_ts[1]}
 
 
 # ---------------------------------------------------------------------------
@@ -330,5 +383,10 @@ async def health():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "8000"))
-    logger.info(f"Starting LeadScraper API on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and not os.getenv("REDIS_URL"):
+        logger.warning("WORKERS > 1 without REDIS_URL — each worker will only see its own jobs")
+    logger.info(f"Starting LeadScraper API on port {port} ({workers} worker(s))")
+    # Import string so uvicorn can spawn workers; "auto" selects uvloop and
+    # httptools when installed and falls back to asyncio/h11 otherwise.
+    uvicorn.run("server:app", host="0.0.0.0", port=port, workers=workers, loop="auto", http="auto")
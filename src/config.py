@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -14,28 +16,53 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = BASE_DIR / "config"
 
 
-def load_config(config_path: str = None) -> dict:
-    """Load YAML config file, merging with defaults."""
-    default_path = CONFIG_DIR / "default.yaml"
+# libyaml's C loader is several times faster when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _mtime(path) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
 
-    with open(default_path) as f:
-        config = yaml.safe_load(f)
+@lru_cache(maxsize=16)
+def _load_config_cached(config_path: str | None, _default_mtime: float, _override_mtime: float) -> dict:
+    """Parse and merge config files. Keyed on mtimes so edits are picked up."""
+    with open(CONFIG_DIR / "default.yaml") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
 
     if config_path:
         with open(config_path) as f:
-            overrides = yaml.safe_load(f)
+            overrides = yaml.load(f, Loader=_YamlLoader)
         _deep_merge(config, overrides)
 
     return config
 
 
+def load_config(config_path: str = None) -> dict:
+    """Load YAML config file, merging with defaults."""
+    config = _load_config_cached(
+        str(config_path) if config_path else None,
+        _mtime(CONFIG_DIR / "default.yaml"),
+        _mtime(config_path) if config_path else 0.0,
+    )
+    # Callers may mutate their config — never hand out the cached dict
+    return copy.deepcopy(config)
+
+
 def _deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override into base dict."""
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    """Merge override into base dict in place (nested dicts are merged, not replaced)."""
+    stack = [(base, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return base
 
 
@@ -45,5 +72,21 @@ REQUEST_DELAY = float(os.getenv("REQUEST_DELAY_SECONDS", "2"))
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 PROXY_URL = os.getenv("PROXY_URL")
+# Shared HTTP connection pool: the enrichment thread pool runs up to 32
+# workers through one client, so keep enough idle connections for them to reuse
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "64"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "32"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+# Database settings from env
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+# Query-engine pool: defaults to 4 connections per CPU so concurrent scrapes
+# don't queue behind Prisma's cpus*2+1 default and hit P2024 timeouts
+DB_CONNECTION_LIMIT = int(os.getenv("DB_CONNECTION_LIMIT", str((os.cpu_count() or 1) * 4)))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+# On-disk MX lookup cache shared across runs and worker processes ("" disables it).
+# Anchored to the project root so processes started from any directory share it.
+MX_CACHE_FILE = os.getenv("MX_CACHE_FILE", str(BASE_DIR / "cache" / "mx.sqlite3"))
+MX_CACHE_TTL = int(os.getenv("MX_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("LOG_FILE", "logs/scraper.log")
@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from prisma import Prisma
 
+from src.config import DB_CONNECTION_LIMIT, DB_POOL_TIMEOUT, DB_STATEMENT_CACHE_SIZE
+
 _client: Prisma | None = None
 
 
+def _datasource_url() -> str | None:
+    """DATABASE_URL with query-engine tuning params applied.
+
+    Prisma caches prepared statements per connection; a larger cache keeps
+    the hot dedup/upsert queries from being re-prepared on every call. The
+    pool size and wait are raised for concurrent scrapes.
+    Params already present in DATABASE_URL win.
+    """
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        return None
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query))
+    params.setdefault("statement_cache_size", str(DB_STATEMENT_CACHE_SIZE))
+    params.setdefault("connection_limit", str(DB_CONNECTION_LIMIT))
+    params.setdefault("pool_timeout", str(DB_POOL_TIMEOUT))
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
+
 async def get_client() -> Prisma:
     """Get or create the Prisma client (connects on first call)."""
     global _client
     if _client is None or not _client.is_connected():
-        _client = Prisma()
+        url = _datasource_url()
+        _client = Prisma(datasource={"url": url}) if url else Prisma()
         await _client.connect()
     return _client
 
@@ -0,0 +1,131 @@
+"""Field-name mapping between scraper dicts (snake_case) and Prisma models (camelCase)."""
+
+from __future__ import annotations
+
+from src.utils.fastjson import dumps as _dumps
+
+# Fields that are stored as Json type in Prisma and need serialization
+_JSON_FIELDS = frozenset({"techStack", "businessHours", "serviceOptions"})
+
+# Mapping from snake_case (used in scrapers/cleaning) to camelCase (Prisma field names)
+FIELD_MAP = {
+    "business_name": "businessName",
+    "business_name_norm": "businessNameNorm",
+    "zip_code": "zipCode",
+    "industry_tags": "industryTags",
+    "owner_name": "ownerName",
+    "owner_title": "ownerTitle",
+    "owner_email": "ownerEmail",
+    "owner_phone": "ownerPhone",
+    "owner_linkedin": "ownerLinkedin",
+    "employee_count": "employeeCount",
+    "annual_revenue_estimate": "annualRevenueEstimate",
+    "year_established": "yearEstablished",
+    "business_type": "businessType",
+    "facebook_url": "facebookUrl",
+    "instagram_url": "instagramUrl",
+    "twitter_url": "twitterUrl",
+    "linkedin_url": "linkedinUrl",
+    "youtube_url": "youtubeUrl",
+    "tiktok_url": "tiktokUrl",
+    "tech_stack": "techStack",
+    "has_website": "hasWebsite",
+    "website_platform": "websitePlatform",
+    "has_ssl": "hasSsl",
+    "mobile_friendly": "mobileFriendly",
+    "google_rating": "googleRating",
+    "google_review_count": "googleReviewCount",
+    "yelp_rating": "yelpRating",
+    "yelp_review_count": "yelpReviewCount",
+    "bbb_rating": "bbbRating",
+    "bbb_accredited": "bbbAccredited",
+    "runs_google_ads": "runsGoogleAds",
+    "runs_facebook_ads": "runsFacebookAds",
+    "has_google_business_profile": "hasGoogleBusinessProfile",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "google_place_id": "googlePlaceId",
+    "business_hours": "businessHours",
+    "photo_count": "photoCount",
+    "price_level": "priceLevel",
+    "description": "description",
+    "service_options": "serviceOptions",
+    "email_verified": "emailVerified",
+    "owner_email_verified": "ownerEmailVerified",
+    "icp_score": "icpScore",
+    "source_url": "sourceUrl",
+    "scraped_at": "scrapedAt",
+    "enriched_at": "enrichedAt",
+    "last_enriched_at": "lastEnrichedAt",
+    "updated_at": "updatedAt",
+    "is_enriched": "isEnriched",
+    "enrichment_errors": "enrichmentErrors",
+    "quality_score": "qualityScore",
+}
+
+# Reverse map: camelCase -> snake_case
+REVERSE_FIELD_MAP = dict(zip(FIELD_MAP.values(), FIELD_MAP.keys()))
+
+# Lead columns whose Prisma field name equals the column name
+_UNMAPPED_COLUMNS = (
+    "id", "phone", "email", "website", "address", "city", "state",
+    "country", "category", "subcategory", "source",
+)
+
+# SELECT list for raw queries parsed into prisma.models.Lead: columns are
+# aliased to Prisma field names so query_raw(..., model=Lead) can parse them.
+LEAD_SELECT_COLUMNS = ", ".join(
+    [f"l.{col}" for col in _UNMAPPED_COLUMNS]
+    + [f'l.{snake} AS "{camel}"' if snake != camel else f"l.{snake}" for snake, camel in FIELD_MAP.items()]
+)
+
+class _Translation(dict):
+    """input key -> (prisma key, is Json field); unknown keys map to themselves.
+
+    Unknown keys (phone, email, city, ...) are already Prisma field names.
+    They are added on first sight, so every later lookup is a plain hit
+    with no fallback branch.
+    """
+
+    def __missing__(self, key):
+        entry = self[key] = (key, False)
+        return entry
+
+
+# Built once so to_prisma_data does a single subscript per key.
+# camelCase Json keys are included so already-converted dicts still serialize.
+_XLATE = _Translation({
+    **{camel: (camel, True) for camel in _JSON_FIELDS},
+    **{snake: (camel, camel in _JSON_FIELDS) for snake, camel in FIELD_MAP.items()},
+})
+
+
+def to_prisma_data(snake_dict: dict) -> dict:
+    """Convert a snake_case dict (from scrapers) to camelCase dict (for Prisma)."""
+    prisma_data = {}
+    xlate = _XLATE.__getitem__
+    dumps = _dumps
+    for key, value in snake_dict.items():
+        if value is None:
+            continue
+        prisma_key, is_json = xlate(key)
+        # Prisma Json fields must be passed as a JSON-serializable value.
+        # Convert dicts/lists to JSON strings to avoid GraphQL parse errors
+        # with keys like "Google Analytics" that contain spaces.
+        if is_json and isinstance(value, (dict, list)):
+            value = dumps(value)
+        prisma_data[prisma_key] = value
+    return prisma_data
+
+
+def to_snake_dict(prisma_obj) -> dict:
+    """Convert a Prisma model instance to a snake_case dict.
+
+    Reads field values straight off the instance instead of going through
+    model_dump(), which recursively copies and validates every field.
+    """
+    obj_dict = getattr(prisma_obj, "__dict__", None)
+    if obj_dict is None:
+        obj_dict = prisma_obj.model_dump() if hasattr(prisma_obj, 'model_dump') else prisma_obj.dict()
+    reverse = REVERSE_FIELD_MAP.get
+    return {reverse(key, key): value for key, value in obj_dict.items()}
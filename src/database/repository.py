@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from datetime import datetime, timezone
+import time
+from datetime import datetime
+from functools import lru_cache
 
 from prisma import Prisma
 from prisma.models import Lead, ScrapeJob
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from src.database.models import to_prisma_data
+from src.database.field_map import LEAD_SELECT_COLUMNS, to_prisma_data
+from src.utils.fastjson import loads
 from src.utils.cleaning import normalize_phone, normalize_email
 
 logger = logging.getLogger(__name__)
@@ -24,39 +28,265 @@ _BIZ_SUFFIXES = re.compile(
 )
 
 
+_PUNCT = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=131072)
 def _normalize_biz_name(name: str) -> str:
-    """Strip business suffixes and punctuation for fuzzy comparison."""
+    """Strip business suffixes and punctuation for fuzzy comparison.
+
+    Cached: the same candidate names come back for every lead in a city.
+    """
     name = _BIZ_SUFFIXES.sub('', name.lower())
-    name = re.sub(r'[^\w\s]', '', name)
+    name = _PUNCT.sub('', name)
     return ' '.join(name.split())
 
 
+def _batch_keys(lead_data: dict) -> list[tuple]:
+    """Exact-match identity keys used to spot duplicates inside one write batch."""
+    keys = []
+    phone = normalize_phone(lead_data.get("phone"))
+    if phone:
+        keys.append(("phone", phone))
+    email = normalize_email(lead_data.get("email"))
+    if email:
+        keys.append(("email", email))
+    name, address = lead_data.get("business_name"), lead_data.get("address")
+    city, state = lead_data.get("city"), lead_data.get("state")
+    if name and address and city and state:
+        keys.append(("identity", name.lower(), address.lower(), city.lower(), state.upper()))
+    return keys
+
+
+# Trigram pre-filter: rows returned to Python for final fuzz.ratio scoring
+FUZZY_CANDIDATES = 5
+# Minimum fuzz.ratio between normalized names for two leads in a city to match
+FUZZY_SCORE_CUTOFF = 85
+# Cleared on the first failed trigram query (extension/index not installed)
+_trgm_available = True
+
+# Rows per multi-row INSERT — keeps statements well under Postgres' bind-parameter limit
+BULK_CHUNK_SIZE = 1000
+
+
+# Below this many (estimated) rows an exact COUNT(*) is cheap enough
+APPROX_COUNT_MIN = 100_000
+
+
+# ── Stats cache ──────────────────────────────────────────────────────────
+# get_stats still aggregates over leads (exactly, below APPROX_COUNT_MIN);
+# dashboards poll it, so serve a cached copy for a short window.
+
+STATS_TTL_SECONDS = 30
+_stats_cache: dict = {"value": None, "expires": 0.0, "pending": None}
+
+
+def _invalidate_stats():
+    _stats_cache["expires"] = 0.0
+    # A refresh already in flight may predate the write; don't cache its result
+    _stats_cache["pending"] = None
+
+
+def _json_col(value):
+    """query_raw hands json columns back either decoded or as text."""
+    return loads(value) if isinstance(value, str) else value
+
+
 class LeadRepository:
     """CRUD operations for leads."""
 
     def __init__(self, client: Prisma):
         self.db = client
+        # Normalized phone/email -> id of a lead known to exist. Scoped to one
+        # scrape job: the same contacts recur across its pages.
+        self._seen_phones: dict[str, int] = {}
+        self._seen_emails: dict[str, int] = {}
+
+    def reset_session_cache(self):
+        """Forget contacts remembered from the previous job."""
+        self._seen_phones.clear()
+        self._seen_emails.clear()
+
+    def _remember_contacts(self, lead_data: dict, lead_id: int):
+        phone = normalize_phone(lead_data.get("phone"))
+        if phone:
+            self._seen_phones.setdefault(phone, lead_id)
+        email = normalize_email(lead_data.get("email"))
+        if email:
+            self._seen_emails.setdefault(email, lead_id)
 
     async def upsert_lead(self, lead_data: dict) -> tuple:
         """Insert or update a lead. Returns (lead, is_new)."""
         existing = await self._find_duplicate(lead_data)
         prisma_data = to_prisma_data(lead_data)
 
-        if existing:
+        if existing is not None:
             # Update existing lead with new data
             update_data = {k: v for k, v in prisma_data.items() if v is not None}
             update_data.pop("businessName", None)  # Don't overwrite name
             lead = await self.db.lead.update(
-                where={"id": existing.id},
+                where={"id": existing},
                 data=update_data,
             )
             return lead, False
 
         lead = await self.db.lead.create(data=prisma_data)
+        self._remember_contacts(lead_data, lead.id)
+        _invalidate_stats()
         return lead, True
 
-    async def _find_duplicate(self, lead_data: dict):
-        """Check for duplicate lead by normalized phone, email, name+address, or fuzzy name match."""
+    async def upsert_many(self, leads: list[dict]) -> dict:
+        """Insert or update a page of leads with bulk writes.
+
+        Duplicate detection against the database is the same as upsert_lead;
+        only the writes are batched. A lead matching one already queued for
+        insert in this batch (same exact keys, or the same fuzzy name check
+        within its city) is folded into it and counted as skipped. Returns
+        {"new", "updated", "skipped"} counts.
+        """
+        stats = {"new": 0, "updated": 0, "skipped": 0}
+        creates: list[dict] = []
+        updates: list[tuple[int, dict]] = []
+        # Identity keys of leads queued for create, so a business listed twice
+        # on the same page folds into one row instead of two
+        pending: dict[tuple, dict] = {}
+        # (city, state) -> ([normalized names], [queued rows]) for in-batch fuzzy matches
+        pending_names: dict[tuple, tuple[list[str], list[dict]]] = {}
+
+        try:
+            by_phone, by_email = await self._prefetch_contacts(leads)
+        except Exception as e:
+            logger.debug(f"Contact prefetch failed, deduping per lead: {e}")
+            by_phone, by_email = {}, {}
+
+        contact_matches = [
+            by_phone.get(normalize_phone(l.get("phone"))) or by_email.get(normalize_email(l.get("email")))
+            for l in leads
+        ]
+        fuzzy = await self._bulk_fuzzy_candidates(
+            {i: l for i, l in enumerate(leads) if contact_matches[i] is None}
+        )
+
+        for i, lead_data in enumerate(leads):
+            try:
+                existing = contact_matches[i] or await self._find_duplicate(
+                    lead_data, candidates=fuzzy.get(i)
+                )
+            except Exception as e:
+                stats["skipped"] += 1
+                logger.debug(f"Skipped lead: {e}")
+                continue
+
+            prisma_data = to_prisma_data(lead_data)
+            if existing is not None:
+                prisma_data.pop("businessName", None)  # Don't overwrite name
+                updates.append((existing, prisma_data))
+                continue
+
+            keys = _batch_keys(lead_data)
+            queued = next((pending[k] for k in keys if k in pending), None)
+            name, city, state = lead_data.get("business_name"), lead_data.get("city"), lead_data.get("state")
+            normalized = _normalize_biz_name(name) if name and city and state else ""
+            place = (city.lower(), state.upper()) if normalized else None
+            if queued is None and place in pending_names:
+                names, rows = pending_names[place]
+                best = process.extractOne(
+                    normalized, names, scorer=fuzz.ratio, score_cutoff=FUZZY_SCORE_CUTOFF
+                )
+                if best is not None:
+                    queued = rows[best[2]]
+            if queued is not None:
+                prisma_data.pop("businessName", None)
+                queued.update({k: v for k, v in prisma_data.items() if v is not None})
+                for k in keys:
+                    pending.setdefault(k, queued)
+                stats["skipped"] += 1
+                continue
+            creates.append(prisma_data)
+            for k in keys:
+                pending[k] = prisma_data
+            if place is not None:
+                names, rows = pending_names.setdefault(place, ([], []))
+                names.append(normalized)
+                rows.append(prisma_data)
+
+        if not creates and not updates:
+            return stats
+
+        # New rows: multi-row INSERT ... ON CONFLICT DO NOTHING, chunked
+        for i in range(0, len(creates), BULK_CHUNK_SIZE):
+            chunk = creates[i:i + BULK_CHUNK_SIZE]
+            try:
+                inserted = await self.db.lead.create_many(data=chunk, skip_duplicates=True)
+                stats["new"] += inserted
+                # Rows that hit uq_lead_identity (e.g. written by a concurrent job)
+                stats["skipped"] += len(chunk) - inserted
+            except Exception as e:
+                # One bad row aborts the whole statement — retry row by row
+                logger.warning(f"Bulk insert of {len(chunk)} leads failed ({e}), retrying individually")
+                for data in chunk:
+                    try:
+                        await self.db.lead.create(data=data)
+                        stats["new"] += 1
+                    except Exception as row_err:
+                        stats["skipped"] += 1
+                        logger.debug(f"Skipped lead: {row_err}")
+
+        # Matched rows: each update carries its own column set, so send them
+        # as one batched transaction rather than a single UPDATE statement
+        if updates:
+            try:
+                async with self.db.batch_() as batcher:
+                    for lead_id, data in updates:
+                        batcher.lead.update(where={"id": lead_id}, data=data)
+                stats["updated"] += len(updates)
+            except Exception as e:
+                logger.warning(f"Batch update of {len(updates)} leads failed ({e}), retrying individually")
+                for lead_id, data in updates:
+                    try:
+                        await self.db.lead.update(where={"id": lead_id}, data=data)
+                        stats["updated"] += 1
+                    except Exception as row_err:
+                        stats["skipped"] += 1
+                        logger.debug(f"Skipped lead: {row_err}")
+
+        if stats["new"]:
+            _invalidate_stats()
+        return stats
+
+    async def _prefetch_contacts(self, leads: list[dict]) -> tuple[dict, dict]:
+        """Existing leads matching any phone or email in the batch, in one query.
+
+        Returns (phone -> lead id, email -> lead id) so exact contact matches
+        skip the per-lead duplicate lookup. Contacts already known from this
+        job are not queried again.
+        """
+        phones = {normalize_phone(l.get("phone")) for l in leads} - {None, ""} - self._seen_phones.keys()
+        emails = {normalize_email(l.get("email")) for l in leads} - {None, ""} - self._seen_emails.keys()
+        if not phones and not emails:
+            return self._seen_phones, self._seen_emails
+
+        rows = await self.db.query_raw(
+            """
+            SELECT id, phone, email FROM leads
+            WHERE phone = ANY($1::text[]) OR email = ANY($2::text[])
+            """,
+            list(phones), list(emails),
+        )
+        for row in rows:
+            if row["phone"] in phones:
+                self._seen_phones.setdefault(row["phone"], row["id"])
+            if row["email"] in emails:
+                self._seen_emails.setdefault(row["email"], row["id"])
+        return self._seen_phones, self._seen_emails
+
+    async def _find_duplicate(self, lead_data: dict, candidates: list[dict] | None = None) -> int | None:
+        """Check for duplicate lead by normalized phone, email, name+address, or fuzzy name match.
+
+        Returns the matching lead's id; only ids and names are read, never
+        whole rows. candidates, when given, are this lead's prefetched fuzzy-match rows
+        (see _bulk_fuzzy_candidates) and replace the per-lead lookup.
+        """
         raw_phone = lead_data.get("phone")
         raw_email = lead_data.get("email")
         name = lead_data.get("business_name")
@@ -64,63 +294,181 @@ class LeadRepository:
         city = lead_data.get("city")
         state = lead_data.get("state")
 
-        # ── 1. Normalize phone then match ──
+        # ── 1–3. Phone, email, or exact name + address — one round-trip ──
         phone = normalize_phone(raw_phone)
-        if phone:
-            match = await self.db.lead.find_first(where={"phone": phone})
-            if match:
-                return match
-
-        # ── 2. Normalize email then match ──
         email = normalize_email(raw_email)
-        if email:
-            match = await self.db.lead.find_first(where={"email": email})
-            if match:
-                return match
-
-        # ── 3. Exact name + address match (case-insensitive) ──
-        if name and address and city and state:
-            match = await self.db.lead.find_first(
-                where={
-                    "businessName": {"equals": name, "mode": "insensitive"},
-                    "address": {"equals": address, "mode": "insensitive"},
-                    "city": {"equals": city, "mode": "insensitive"},
-                    "state": state.upper(),
-                }
+        # Contacts matched earlier in this job; email only decides when there
+        # is no phone, so an unseen phone still gets its precedence
+        if phone and phone in self._seen_phones:
+            return self._seen_phones[phone]
+        if not phone and email and email in self._seen_emails:
+            return self._seen_emails[email]
+
+        has_identity = bool(name and address and city and state)
+        if phone or email or has_identity:
+            # NULL params never compare equal, so absent keys drop out of the OR.
+            # Ordering keeps the old precedence: phone, then email, then name+address.
+            rows = await self.db.query_raw(
+                """
+                SELECT id, CASE WHEN phone = $1::text THEN 0 WHEN email = $2::text THEN 1 ELSE 2 END AS match_rank
+                FROM leads
+                WHERE phone = $1::text
+                   OR email = $2::text
+                   OR (lower(business_name) = lower($3::text) AND lower(address) = lower($4::text)
+                       AND lower(city) = lower($5::text) AND state = $6::text)
+                ORDER BY match_rank
+                LIMIT 1
+                """,
+                phone, email,
+                *((name, address, city, state.upper()) if has_identity else (None, None, None, None)),
             )
-            if match:
-                return match
+            if rows:
+                lead_id, rank = rows[0]["id"], rows[0]["match_rank"]
+                if rank == 0:
+                    self._seen_phones[phone] = lead_id
+                elif rank == 1:
+                    self._seen_emails[email] = lead_id
+                return lead_id
 
         # ── 4. Fuzzy name match within same city+state ──
         if name and city and state:
             normalized_incoming = _normalize_biz_name(name)
             if normalized_incoming:
-                candidates = await self.db.lead.find_many(
-                    where={
-                        "city": {"equals": city, "mode": "insensitive"},
-                        "state": state.upper(),
-                    },
-                    take=50,
+                if candidates is None:
+                    candidates = await self._fuzzy_candidates(normalized_incoming, city, state)
+                # Score the whole candidate list in one C call
+                best = process.extractOne(
+                    normalized_incoming,
+                    [_normalize_biz_name(c["business_name"]) for c in candidates],
+                    scorer=fuzz.ratio,
+                    score_cutoff=FUZZY_SCORE_CUTOFF,
                 )
-                for candidate in candidates:
-                    normalized_existing = _normalize_biz_name(candidate.businessName)
-                    if normalized_existing and fuzz.ratio(normalized_incoming, normalized_existing) >= 85:
-                        logger.debug(
-                            f"[Dedup] Fuzzy match: '{name}' ≈ '{candidate.businessName}' "
-                            f"(score={fuzz.ratio(normalized_incoming, normalized_existing)})"
-                        )
-                        return candidate
+                if best is not None:
+                    _, score, idx = best
+                    candidate = candidates[idx]
+                    logger.debug(
+                        f"[Dedup] Fuzzy match: '{name}' ≈ '{candidate['business_name']}' (score={score:.0f})"
+                    )
+                    return candidate["id"]
 
         return None
 
-    async def get_unenriched_leads(self, limit: int = 100):
-        """Get leads that haven't been enriched yet."""
+    async def _bulk_fuzzy_candidates(self, leads: dict[int, dict]) -> dict[int, list[dict]]:
+        """Fuzzy-match candidates for many leads in one query.
+
+        Joins the incoming (city, state, normalized name) rows against leads
+        with a LATERAL trigram lookup. Returns {key: candidates} for every
+        lead that has a name and location; leads missing from the result
+        fall back to the per-lead lookup in _find_duplicate.
+        """
+        if not _trgm_available:
+            return {}
+        keys, cities, states, names = [], [], [], []
+        for key, lead in leads.items():
+            name, city, state = lead.get("business_name"), lead.get("city"), lead.get("state")
+            normalized = _normalize_biz_name(name) if name else ""
+            if normalized and city and state:
+                keys.append(key)
+                cities.append(city)
+                states.append(state.upper())
+                names.append(normalized)
+        if not keys:
+            return {}
+
+        try:
+            rows = await self.db.query_raw(
+                """
+                SELECT v.k, l.id, l.business_name
+                FROM unnest($1::int[], $2::text[], $3::text[], $4::text[]) AS v(k, city, state, name_norm)
+                CROSS JOIN LATERAL (
+                    SELECT id, business_name FROM leads
+                    WHERE leads.state = v.state AND lower(leads.city) = lower(v.city)
+                      AND leads.business_name_norm % v.name_norm
+                    ORDER BY similarity(leads.business_name_norm, v.name_norm) DESC
+                    LIMIT $5
+                ) l
+                """,
+                keys, cities, states, names, FUZZY_CANDIDATES,
+            )
+        except Exception as e:
+            logger.debug(f"[Dedup] Bulk fuzzy lookup failed, falling back per lead: {e}")
+            return {}
+
+        result: dict[int, list[dict]] = {key: [] for key in keys}
+        for row in rows:
+            result[row["k"]].append({"id": row["id"], "business_name": row["business_name"]})
+        return result
+
+    async def _fuzzy_candidates(self, normalized_name: str, city: str, state: str) -> list[dict]:
+        """Closest-named leads in a city as {"id", "business_name"} dicts.
+
+        Uses the pg_trgm index from prisma/post_push.sql so only a handful of
+        rows leave the database; falls back to a plain city scan without it.
+        """
+        global _trgm_available
+        if _trgm_available:
+            try:
+                return await self.db.query_raw(
+                    """
+                    SELECT id, business_name FROM leads
+                    WHERE state = $1 AND lower(city) = lower($2)
+                      AND business_name_norm % $3
+                    ORDER BY similarity(business_name_norm, $3) DESC
+                    LIMIT $4
+                    """,
+                    state.upper(), city, normalized_name, FUZZY_CANDIDATES,
+                )
+            except Exception as e:
+                _trgm_available = False
+                logger.warning(f"[Dedup] pg_trgm lookup unavailable ({e}); run `python main.py init-db`")
+
+        return await self.db.query_raw(
+            """
+            SELECT id, business_name FROM leads
+            WHERE state = $1 AND lower(city) = lower($2)
+            LIMIT 50
+            """,
+            state.upper(), city,
+        )
+
+    async def get_unenriched_leads(self, limit: int = 100, before: datetime | None = None,
+                                   before_id: int | None = None):
+        """Get leads that haven't been enriched yet, newest first.
+
+        Pass the last row's scrapedAt (and id) as before/before_id to fetch
+        the next page by keyset instead of re-scanning earlier rows. Leads
+        bulk-inserted together share a scrapedAt, so id breaks the tie.
+        """
+        where: dict = {"isEnriched": False}
+        if before is not None:
+            if before_id is not None:
+                where["OR"] = [
+                    {"scrapedAt": {"lt": before}},
+                    {"scrapedAt": before, "id": {"lt": before_id}},
+                ]
+            else:
+                where["scrapedAt"] = {"lt": before}
         return await self.db.lead.find_many(
-            where={"isEnriched": False},
-            order={"scrapedAt": "desc"},
+            where=where,
+            order=[{"scrapedAt": "desc"}, {"id": "desc"}],
             take=limit,
         )
 
+    async def reset_and_fetch(self, ids: list[int]) -> list[Lead]:
+        """Mark leads as unenriched and return the updated rows in one round-trip."""
+        if not ids:
+            return []
+        return await self.db.query_raw(
+            f"""
+            UPDATE leads AS l
+            SET is_enriched = false, updated_at = now() AT TIME ZONE 'UTC'
+            WHERE l.id = ANY($1::int[])
+            RETURNING {LEAD_SELECT_COLUMNS}
+            """,
+            list(ids),
+            model=Lead,
+        )
+
     async def get_leads_by_location(self, state: str, city: str = None):
         """Get all leads for a given state/city."""
         where = {"state": state.upper()}
@@ -138,46 +486,110 @@ class LeadRepository:
         """Get total number of leads."""
         return await self.db.lead.count()
 
-    async def get_stats(self) -> dict:
-        """Get summary statistics."""
-        total = await self.db.lead.count()
-        enriched = await self.db.lead.count(where={"isEnriched": True})
-
-        # Top states via raw query
-        by_state = await self.db.query_raw(
-            """
-            SELECT state, COUNT(*)::int as count
-            FROM leads
-            WHERE state IS NOT NULL
-            GROUP BY state
-            ORDER BY count DESC
-            LIMIT 10
-            """
+    async def _estimated_lead_count(self) -> int:
+        """Planner estimate of the lead count (-1 if never analyzed) — O(1)."""
+        rows = await self.db.query_raw(
+            "SELECT reltuples::bigint AS n FROM pg_class WHERE oid = 'leads'::regclass"
         )
+        return int(rows[0]["n"]) if rows else -1
 
-        # Top categories via raw query
-        by_category = await self.db.query_raw(
+    async def get_stats(self) -> dict:
+        """Get summary statistics (cached for STATS_TTL_SECONDS)."""
+        if _stats_cache["value"] is not None and time.monotonic() < _stats_cache["expires"]:
+            return _stats_cache["value"]
+
+        # Single-flight: pollers arriving while a refresh is running share it
+        pending = _stats_cache.get("pending")
+        if pending is None or pending.done():
+            pending = asyncio.ensure_future(self._compute_stats())
+            _stats_cache["pending"] = pending
+        stats = await asyncio.shield(pending)
+        if _stats_cache.get("pending") is pending:
+            _stats_cache["pending"] = None
+            _stats_cache["value"] = stats
+            _stats_cache["expires"] = time.monotonic() + STATS_TTL_SECONDS
+        return stats
+
+    async def _compute_stats(self) -> dict:
+        # Large tables skip the full scan: planner estimate for the total, the
+        # partial unenriched index for the backlog, a 1% block sample for the
+        # average. Below APPROX_COUNT_MIN everything is exact.
+        estimate = await self._estimated_lead_count()
+        if estimate >= APPROX_COUNT_MIN:
+            totals_sql = """
+                SELECT $1::int AS total,
+                       GREATEST($1 - (SELECT COUNT(*) FROM leads WHERE is_enriched = false), 0)::int
+                           AS enriched,
+                       COALESCE((SELECT AVG(quality_score) FROM leads TABLESAMPLE SYSTEM (1)), 0)::float
+                           AS avg_score
             """
-            SELECT category, COUNT(*)::int as count
-            FROM leads
-            WHERE category IS NOT NULL AND category != ''
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 10
+            params = (estimate,)
+        else:
+            totals_sql = """
+                SELECT COUNT(*)::int AS total,
+                       (COUNT(*) FILTER (WHERE is_enriched))::int AS enriched,
+                       COALESCE(AVG(quality_score), 0)::float AS avg_score
+                FROM leads
             """
+            params = ()
+
+        # All aggregates in one round-trip; the CTE results come back as JSON.
+        # Top lists come from the trigger-maintained rollups (prisma/post_push.sql);
+        # if those are empty (post_push.sql never applied) they're grouped live.
+        rows = await self.db.query_raw(
+            f"""
+            WITH t AS ({totals_sql}),
+            s_rollup AS (
+                SELECT state, count FROM lead_state_counts
+                WHERE count > 0
+                ORDER BY count DESC
+                LIMIT 10
+            ),
+            s AS (
+                SELECT * FROM s_rollup
+                UNION ALL
+                (SELECT state, COUNT(*)::int AS count
+                 FROM leads
+                 WHERE state IS NOT NULL AND NOT EXISTS (SELECT 1 FROM s_rollup)
+                 GROUP BY state
+                 ORDER BY count DESC
+                 LIMIT 10)
+            ),
+            c_rollup AS (
+                SELECT category, count FROM lead_category_counts
+                WHERE count > 0
+                ORDER BY count DESC
+                LIMIT 10
+            ),
+            c AS (
+                SELECT * FROM c_rollup
+                UNION ALL
+                (SELECT category, COUNT(*)::int AS count
+                 FROM leads
+                 WHERE category IS NOT NULL AND category != ''
+                   AND NOT EXISTS (SELECT 1 FROM c_rollup)
+                 GROUP BY category
+                 ORDER BY count DESC
+                 LIMIT 10)
+            )
+            SELECT (SELECT row_to_json(t) FROM t) AS totals,
+                   (SELECT COALESCE(json_agg(s), '[]'::json) FROM s) AS top_states,
+                   (SELECT COALESCE(json_agg(c), '[]'::json) FROM c) AS top_categories
+            """,
+            *params,
         )
-
-        # Average quality score
-        avg_result = await self.db.query_raw(
-            "SELECT COALESCE(AVG(quality_score), 0)::float as avg_score FROM leads"
-        )
-        avg_quality = avg_result[0]["avg_score"] if avg_result else 0
+        row = rows[0]
+        totals = _json_col(row["totals"]) or {}
+        by_state = _json_col(row["top_states"]) or []
+        by_category = _json_col(row["top_categories"]) or []
+        total = totals.get("total", 0)
+        enriched = totals.get("enriched", 0)
 
         return {
             "total_leads": total,
             "enriched_leads": enriched,
             "unenriched_leads": total - enriched,
-            "avg_quality_score": round(float(avg_quality), 1),
+            "avg_quality_score": round(float(totals.get("avg_score", 0)), 1),
             "top_states": [{"state": r["state"], "count": r["count"]} for r in by_state],
             "top_categories": [{"category": r["category"], "count": r["count"]} for r in by_category],
         }
@@ -204,39 +616,38 @@ class JobRepository:
             }
         )
 
+    # Duration is computed inside the UPDATE, so finishing a job is one
+    # round-trip. Prisma stores DateTime as UTC timestamps without time zone.
+
     async def complete_job(self, job_id: int, leads_found: int, leads_new: int,
-                           leads_updated: int, leads_skipped: int, errors: str = None):
+                           leads_updated: int, leads_skipped: int, errors: str = None) -> int:
         """Mark a job as completed."""
-        now = datetime.now(timezone.utc)
-        job = await self.db.scrapejob.find_unique(where={"id": job_id})
-        duration = (now - job.startedAt).total_seconds() if job else 0
-
-        return await self.db.scrapejob.update(
-            where={"id": job_id},
-            data={
-                "status": "completed",
-                "leadsFound": leads_found,
-                "leadsNew": leads_new,
-                "leadsUpdated": leads_updated,
-                "leadsSkipped": leads_skipped,
-                "errors": errors,
-                "completedAt": now,
-                "durationSeconds": duration,
-            },
+        return await self.db.execute_raw(
+            """
+            UPDATE scrape_jobs SET
+                status = 'completed',
+                leads_found = $2,
+                leads_new = $3,
+                leads_updated = $4,
+                leads_skipped = $5,
+                errors = $6,
+                completed_at = now() AT TIME ZONE 'UTC',
+                duration_seconds = EXTRACT(EPOCH FROM (now() AT TIME ZONE 'UTC') - started_at)
+            WHERE id = $1
+            """,
+            job_id, leads_found, leads_new, leads_updated, leads_skipped, errors,
         )
 
-    async def fail_job(self, job_id: int, error: str):
+    async def fail_job(self, job_id: int, error: str) -> int:
         """Mark a job as failed."""
-        now = datetime.now(timezone.utc)
-        job = await self.db.scrapejob.find_unique(where={"id": job_id})
-        duration = (now - job.startedAt).total_seconds() if job else 0
-
-        return await self.db.scrapejob.update(
-            where={"id": job_id},
-            data={
-                "status": "failed",
-                "errors": error,
-                "completedAt": now,
-                "durationSeconds": duration,
-            },
+        return await self.db.execute_raw(
+            """
+            UPDATE scrape_jobs SET
+                status = 'failed',
+                errors = $2,
+                completed_at = now() AT TIME ZONE 'UTC',
+                duration_seconds = EXTRACT(EPOCH FROM (now() AT TIME ZONE 'UTC') - started_at)
+            WHERE id = $1
+            """,
+            job_id, error,
         )
@@ -2,24 +2,97 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 
 from src.config import load_config
 from src.database.connection import get_client, disconnect
 from src.database.repository import LeadRepository, JobRepository
+from src.scrapers.http_client import ScraperHttpClient
+from src.scrapers.base import BaseScraper
 from src.scrapers.registry import get_scraper
-from src.enrichment.pipeline import EnrichmentPipeline
+from src.enrichment.pipeline import DEFAULT_CONCURRENCY, EnrichmentPipeline
 from src.utils.us_locations import get_locations
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on remembered lead keys before a run's seen set is reset
+SEEN_LEADS_MAX = 200_000
+
+# Leads per upsert_many call — bounds statement size and the blast radius of a bad batch
+UPSERT_CHUNK_SIZE = 500
+
+# Unenriched leads fetched per query when working through the enrichment queue
+ENRICH_PAGE_SIZE = 100
+
 
 class ScraperEngine:
     """Main engine that ties together scraping, enrichment, and storage."""
 
     def __init__(self, config_path: str = None):
         self.config = load_config(config_path)
+        # One HTTP client (connection pool + Playwright browser) shared by
+        # every scrape job this engine runs; created on first use.
+        self._http: ScraperHttpClient | None = None
+        # One scraper per source, reused by every category/location job
+        # (scrapers keep no per-search state, so concurrent jobs can share one)
+        self._scrapers: dict[str, BaseScraper] = {}
+        # Database client and repositories, held for the engine's lifetime
+        # (see connect/disconnect, or use the engine as an async context manager)
+        self._db = None
+        self._lead_repo: LeadRepository | None = None
+        self._job_repo: JobRepository | None = None
+
+    def _get_http(self) -> ScraperHttpClient:
+        if self._http is None:
+            self._http = ScraperHttpClient()
+        return self._http
+
+    def _get_scraper(self, source_name: str) -> BaseScraper:
+        scraper = self._scrapers.get(source_name)
+        if scraper is None:
+            scraper = get_scraper(source_name, http=self._get_http())
+            self._scrapers[source_name] = scraper
+        return scraper
+
+    async def _get_db(self):
+        """The shared Prisma client; repositories are rebuilt if it changed."""
+        db = await get_client()
+        if db is not self._db:
+            self._db = db
+            self._lead_repo = LeadRepository(db)
+            self._job_repo = JobRepository(db)
+        return db
+
+    async def connect(self):
+        """Open the database connection used by every job this engine runs."""
+        await self._get_db()
+
+    async def disconnect(self):
+        """Close the database connection (the HTTP client stays open)."""
+        await disconnect()
+        self._db = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.disconnect()
+
+    def close(self):
+        """Close the cached scrapers and the shared HTTP client and browser."""
+        for scraper in self._scrapers.values():
+            try:
+                scraper.close()
+            except Exception:
+                pass
+        self._scrapers.clear()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     async def run(self) -> dict:
         """Run the full scraping pipeline based on config."""
@@ -36,65 +109,90 @@ class ScraperEngine:
             cities=targeting.get("cities", []),
         )
 
-        total_stats = {
-            "total_found": 0,
-            "total_new": 0,
-            "total_updated": 0,
-            "total_skipped": 0,
-            "total_enriched": 0,
-            "errors": [],
-        }
+        totals = Counter(
+            total_found=0, total_new=0, total_updated=0, total_skipped=0,
+        )
+        # Leads already written during this run, keyed by the same identity as
+        # uq_lead_identity (+ zip) — repeat listings across categories/pages
+        # skip the dedup + upsert round-trips. Per call, so concurrent jobs on
+        # a shared engine don't clear each other's and re-scrapes still
+        # refresh existing rows.
+        seen: set[tuple] = set()
+        errors: list[str] = []
+
+        # Combinations hit independent targets and rows, so overlap them;
+        # per-domain rate limiting in the HTTP client still applies.
+        sem = asyncio.Semaphore(max(1, int(scraping.get("concurrency", 8))))
+
+        async def _bounded(source_name: str, category: str, location: str) -> dict:
+            async with sem:
+                return await self._scrape_single(source_name, category, location, max_pages, seen)
+
+        results = await asyncio.gather(
+            *(
+                _bounded(source_name, category, location)
+                for source_name in sources
+                for category in categories
+                for location in locations
+            ),
+            return_exceptions=True,
+        )
+
+        for stats in results:
+            if isinstance(stats, BaseException):
+                errors.append(str(stats))
+                continue
+            totals.update({f"total_{k}": v for k, v in stats.items() if k != "error"})
+            if stats.get("error"):
+                errors.append(stats["error"])
 
-        for source_name in sources:
-            for category in categories:
-                for location in locations:
-                    stats = await self._scrape_single(
-                        source_name, category, location, max_pages
-                    )
-                    total_stats["total_found"] += stats.get("found", 0)
-                    total_stats["total_new"] += stats.get("new", 0)
-                    total_stats["total_updated"] += stats.get("updated", 0)
-                    total_stats["total_skipped"] += stats.get("skipped", 0)
-                    if stats.get("error"):
-                        total_stats["errors"].append(stats["error"])
+        total_stats = {**totals, "total_enriched": 0, "errors": errors}
 
         # Run enrichment if enabled
         if enrichment_config.get("enabled", True):
             enriched = await self._run_enrichment(enrichment_config)
             total_stats["total_enriched"] = enriched
 
-        await disconnect()
         logger.info(f"Scraping complete: {total_stats}")
         return total_stats
 
     async def _scrape_single(
-        self, source_name: str, category: str, location: str, max_pages: int
+        self, source_name: str, category: str, location: str, max_pages: int, seen: set[tuple]
     ) -> dict:
-        """Scrape a single source/category/location combination."""
-        db = await get_client()
+        """Scrape a single source/category/location combination.
+
+        seen holds the lead keys already written by the calling run; it is
+        read to skip repeats and extended as new leads are stored.
+        """
+        db = await self._get_db()
+        # Per job: the lead repository carries this job's seen-contact cache
         lead_repo = LeadRepository(db)
-        job_repo = JobRepository(db)
+        job_repo = self._job_repo
 
         job = await job_repo.create_job(source_name, category, location)
+        lead_repo.reset_session_cache()
 
         stats = {"found": 0, "new": 0, "updated": 0, "skipped": 0, "error": None}
 
-        scraper = None
         try:
-            scraper = get_scraper(source_name)
-            leads = scraper.scrape(category, location, max_pages)
-            stats["found"] = len(leads)
-
-            for lead_data in leads:
-                try:
-                    lead, is_new = await lead_repo.upsert_lead(lead_data)
-                    if is_new:
-                        stats["new"] += 1
-                    else:
-                        stats["updated"] += 1
-                except Exception as e:
-                    stats["skipped"] += 1
-                    logger.debug(f"Skipped lead: {e}")
+            scraper = self._get_scraper(source_name)
+            # Leads are written while later pages are still being fetched;
+            # the bounded queue keeps at most a couple of batches in memory
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2 * UPSERT_CHUNK_SIZE)
+            writer = asyncio.create_task(
+                self._drain_leads(queue, lead_repo, source_name, stats, seen)
+            )
+            try:
+                async for lead_data in scraper.scrape_stream(category, location, max_pages):
+                    stats["found"] += 1
+                    key = self._lead_key(source_name, lead_data)
+                    if key in seen:
+                        stats["skipped"] += 1
+                        continue
+                    await queue.put((key, lead_data))
+            finally:
+                await queue.put(None)
+                await writer
 
             await job_repo.complete_job(
                 job.id, stats["found"], stats["new"],
@@ -112,39 +210,103 @@ class ScraperEngine:
             logger.error(error_msg)
             stats["error"] = error_msg
             await job_repo.fail_job(job.id, str(e))
-        finally:
-            # Close scraper to free Playwright browser resources
-            if scraper:
-                try:
-                    scraper.close()
-                except Exception:
-                    pass
 
         return stats
 
-    async def _run_enrichment(self, enrichment_config: dict) -> int:
-        """Run enrichment on unenriched leads."""
-        modules = enrichment_config.get("modules", [])
-        db = await get_client()
-        lead_repo = LeadRepository(db)
+    async def _drain_leads(
+        self, queue: asyncio.Queue, lead_repo: LeadRepository, source_name: str, stats: dict,
+        seen: set[tuple],
+    ):
+        """Upsert queued (key, lead) pairs in UPSERT_CHUNK_SIZE batches until None."""
+        done = False
+        while not done:
+            chunk = []
+            while len(chunk) < UPSERT_CHUNK_SIZE:
+                item = await queue.get()
+                if item is None:
+                    done = True
+                    break
+                chunk.append(item)
+            if not chunk:
+                continue
+            try:
+                result = await lead_repo.upsert_many([lead for _, lead in chunk])
+            except Exception as e:
+                logger.warning(f"[{source_name}] Upsert of {len(chunk)} leads failed: {e}")
+                stats["skipped"] += len(chunk)
+                continue
+            for k in ("new", "updated", "skipped"):
+                stats[k] += result[k]
+            # Only trust the keys when every lead made it to the database
+            if not result["skipped"]:
+                for key, _ in chunk:
+                    self._remember_lead(seen, key)
+
+    @staticmethod
+    def _lead_key(source_name: str, lead_data: dict) -> tuple:
+        """Identity matching uq_lead_identity (name/address/city/state) plus zip."""
+        return (
+            source_name,
+            (lead_data.get("business_name") or "").lower(),
+            (lead_data.get("address") or "").lower(),
+            (lead_data.get("city") or "").lower(),
+            (lead_data.get("state") or "").lower(),
+            lead_data.get("zip_code") or "",
+        )
 
-        unenriched = await lead_repo.get_unenriched_leads(limit=200)
-        if not unenriched:
-            logger.info("No leads to enrich")
-            return 0
+    @staticmethod
+    def _remember_lead(seen: set[tuple], key: tuple):
+        if len(seen) >= SEEN_LEADS_MAX:
+            seen.clear()
+        seen.add(key)
+
+    @staticmethod
+    def _pipeline(enrichment_config: dict) -> EnrichmentPipeline:
+        return EnrichmentPipeline(
+            enabled_modules=enrichment_config.get("modules", []),
+            concurrency=enrichment_config.get("concurrency", DEFAULT_CONCURRENCY),
+        )
 
-        logger.info(f"Enriching {len(unenriched)} leads...")
+    async def _enrich_unenriched(self, enrichment_config: dict, limit: int) -> dict:
+        """Enrich up to limit unenriched leads, newest first, a page at a time.
 
-        with EnrichmentPipeline(enabled_modules=modules) as pipeline:
-            results = await pipeline.enrich_batch(unenriched, db)
+        Pages continue from the last lead seen (keyset), so leads that fail
+        and stay unenriched are not fetched again within the same call.
+        """
+        db = await self._get_db()
+        lead_repo = self._lead_repo
+        totals = {"total": 0, "success": 0, "failed": 0}
+        before = before_id = None
+
+        with self._pipeline(enrichment_config) as pipeline:
+            while totals["total"] < limit:
+                page = await lead_repo.get_unenriched_leads(
+                    limit=min(ENRICH_PAGE_SIZE, limit - totals["total"]),
+                    before=before, before_id=before_id,
+                )
+                if not page:
+                    break
+                results = await pipeline.enrich_batch(page, db)
+                for k in totals:
+                    totals[k] += results[k]
+                before, before_id = page[-1].scrapedAt, page[-1].id
+
+        return totals
 
+    async def _run_enrichment(self, enrichment_config: dict) -> int:
+        """Run enrichment on unenriched leads."""
+        results = await self._enrich_unenriched(enrichment_config, limit=200)
+        if not results["total"]:
+            logger.info("No leads to enrich")
+        else:
+            logger.info(f"Enriched {results['success']}/{results['total']} leads")
         return results["success"]
 
     async def scrape_single_source(
         self, source: str, category: str, location: str, max_pages: int = 5
     ) -> dict:
         """Scrape a single source/category/location, then auto-enrich new leads."""
-        result = await self._scrape_single(source, category, location, max_pages)
+        result = await self._scrape_single(source, category, location, max_pages, set())
 
         # Auto-enrich the newly scraped leads
         enrichment_config = self.config.get("enrichment", {})
@@ -153,49 +315,27 @@ class ScraperEngine:
             enriched = await self._run_enrichment(enrichment_config)
             result["enriched"] = enriched
 
-        await disconnect()
         return result
 
     async def enrich_only(self, limit: int = 100) -> dict:
         """Only run enrichment, no scraping."""
         enrichment_config = self.config.get("enrichment", {})
-        modules = enrichment_config.get("modules", [])
-        db = await get_client()
-        lead_repo = LeadRepository(db)
-
-        unenriched = await lead_repo.get_unenriched_leads(limit=limit)
-        if not unenriched:
-            await disconnect()
-            return {"total": 0, "success": 0, "failed": 0}
-
-        with EnrichmentPipeline(enabled_modules=modules) as pipeline:
-            results = await pipeline.enrich_batch(unenriched, db)
-
-        await disconnect()
-        return results
+        return await self._enrich_unenriched(enrichment_config, limit)
 
     async def enrich_single(self, lead_id: int) -> dict:
         """Enrich a single lead by ID."""
         enrichment_config = self.config.get("enrichment", {})
-        modules = enrichment_config.get("modules", [])
-        db = await get_client()
-
-        lead = await db.lead.find_unique(where={"id": lead_id})
-        if not lead:
-            await disconnect()
-            raise ValueError(f"Lead {lead_id} not found")
+        db = await self._get_db()
 
         # Reset enrichment so pipeline treats it fresh
-        await db.lead.update(
-            where={"id": lead_id},
-            data={"isEnriched": False},
-        )
-        lead = await db.lead.find_unique(where={"id": lead_id})
+        reset = await self._lead_repo.reset_and_fetch([lead_id])
+        if not reset:
+            raise ValueError(f"Lead {lead_id} not found")
+        lead = reset[0]
 
-        with EnrichmentPipeline(enabled_modules=modules) as pipeline:
+        with self._pipeline(enrichment_config) as pipeline:
             updated = await pipeline.enrich_lead(lead, db)
 
-        await disconnect()
         return {
             "id": lead_id,
             "businessName": updated.businessName,
@@ -207,24 +347,16 @@ class ScraperEngine:
     async def enrich_multiple(self, lead_ids: list[int]) -> dict:
         """Enrich multiple leads by IDs."""
         enrichment_config = self.config.get("enrichment", {})
-        modules = enrichment_config.get("modules", [])
-        db = await get_client()
+        db = await self._get_db()
 
         # Reset enrichment status
-        await db.lead.update_many(
-            where={"id": {"in": lead_ids}},
-            data={"isEnriched": False},
-        )
-
-        leads = await db.lead.find_many(where={"id": {"in": lead_ids}})
+        leads = await self._lead_repo.reset_and_fetch(lead_ids)
         if not leads:
-            await disconnect()
             return {"total": 0, "success": 0, "failed": 0}
 
-        with EnrichmentPipeline(enabled_modules=modules) as pipeline:
+        with self._pipeline(enrichment_config) as pipeline:
             results = await pipeline.enrich_batch(leads, db)
 
-        await disconnect()
         return results
 
     async def re_enrich(self, stale_days: int = 30, limit: int = 50) -> dict:
@@ -234,8 +366,7 @@ class ScraperEngine:
         This refreshes data that may have changed (new phone, new website, etc.).
         """
         enrichment_config = self.config.get("enrichment", {})
-        modules = enrichment_config.get("modules", [])
-        db = await get_client()
+        db = await self._get_db()
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=stale_days)
 
@@ -254,27 +385,18 @@ class ScraperEngine:
 
         if not stale_leads:
             logger.info("No stale leads to re-enrich")
-            await disconnect()
             return {"total": 0, "success": 0, "failed": 0, "stale_found": 0}
 
         logger.info(f"Found {len(stale_leads)} stale leads (>{stale_days} days old)")
 
         # Reset enrichment status so pipeline treats them as fresh
+        # (the UPDATE returns the rows, so no re-fetch is needed)
         stale_ids = [lead.id for lead in stale_leads]
-        await db.lead.update_many(
-            where={"id": {"in": stale_ids}},
-            data={"isEnriched": False},
-        )
-        logger.info(f"Reset {len(stale_ids)} leads for re-enrichment")
+        leads_to_enrich = await self._lead_repo.reset_and_fetch(stale_ids)
+        logger.info(f"Reset {len(leads_to_enrich)} leads for re-enrichment")
 
-        # Fetch them fresh (with isEnriched=False)
-        leads_to_enrich = await db.lead.find_many(
-            where={"id": {"in": stale_ids}},
-        )
-
-        with EnrichmentPipeline(enabled_modules=modules) as pipeline:
+        with self._pipeline(enrichment_config) as pipeline:
             results = await pipeline.enrich_batch(leads_to_enrich, db)
 
         results["stale_found"] = len(stale_leads)
-        await disconnect()
         return results
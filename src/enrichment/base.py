@@ -4,9 +4,130 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from src.scrapers.http_client import html_to_text
+from src.utils.fastjson import JSONDecodeError, loads
 
 logger = logging.getLogger(__name__)
 
+# Email domains that never belong to the business: platforms, CDNs,
+# trackers and directories that turn up in page markup
+JUNK_EMAIL_DOMAINS = frozenset({
+    "example.com", "domain.com", "email.com", "test.com",
+    "sentry.io", "wixpress.com", "wordpress.com",
+    "squarespace.com", "godaddy.com", "weebly.com", "wix.com",
+    "shopify.com", "googleapis.com", "gravatar.com", "w3.org",
+    "schema.org", "facebook.com", "twitter.com", "instagram.com",
+    "cloudflare.com", "google.com", "google.de", "google.co.uk",
+    "google.ca", "google.com.au", "google.co.in",
+    "gstatic.com", "jquery.com",
+    "bootstrapcdn.com", "jsdelivr.net", "unpkg.com", "cdnjs.com",
+    "fontawesome.com", "sonsio.com", "shell.com",
+    "yelp.com", "bbb.org", "yellowpages.com",
+})
+
+# Role mailboxes rather than a person (info@, sales@, noreply@)
+GENERIC_PREFIXES = frozenset({
+    "info", "contact", "hello", "support", "admin", "sales",
+    "billing", "office", "help", "service", "team", "inquiries",
+    "general", "mail", "enquiries", "reception", "accounts",
+    "customerservice", "cs", "orders", "noreply", "no-reply",
+    "webmaster",
+})
+
+
+def is_junk_email_domain(domain: str) -> bool:
+    """Check if an email domain is junk (Google, social media, platform, etc).
+
+    Subdomains count too (o123.ingest.sentry.io): the domain and each parent
+    are looked up in the set, one hash lookup per label.
+    """
+    # Catch all Google country domains (google.de, google.fr, google.co.uk, etc)
+    if domain.startswith("google.") or ".google." in domain:
+        return True
+    while domain:
+        if domain in JUNK_EMAIL_DOMAINS:
+            return True
+        domain = domain.partition(".")[2]
+    return False
+
+
+def linkedin_profile_url(href: str | None) -> str | None:
+    """Clean linkedin.com/in/ profile URL from a search-result href, if it is one."""
+    if not href or "linkedin.com/in/" not in href:
+        return None
+    if href.startswith("/url?q="):
+        href = href.split("/url?q=")[1].split("&")[0]
+    path = urlparse(href).path
+    if "/in/" not in path:
+        return None
+    return f"https://www.linkedin.com{path}".rstrip("/")
+
+
+def _is_linkedin_profile(href: str | None) -> bool:
+    return linkedin_profile_url(href) is not None
+
+
+def find_linkedin_profile(soup) -> str | None:
+    """First LinkedIn profile link on a search-results page.
+
+    soup.find stops at the first matching anchor instead of collecting every
+    link on the page first.
+    """
+    a = soup.find("a", href=_is_linkedin_profile)
+    return linkedin_profile_url(a["href"]) if a else None
+
+
+def page_text(soup) -> str:
+    """soup.get_text(separator=" "), computed once per soup.
+
+    The shared HTTP client hands the same cached soup for a site's pages to
+    every module, so the text is stored on the soup after the first walk.
+    Soups from get_soup carry their markup, which html_to_text strips with a
+    regex — much faster than get_text's node-by-node walk.
+    """
+    # Read __dict__ directly: attribute access on a soup falls back to a tag search
+    text = soup.__dict__.get("_page_text")
+    if text is None:
+        markup = soup.__dict__.pop("_markup", None)
+        text = html_to_text(markup) if markup is not None else soup.get_text(separator=" ")
+        soup.__dict__["_page_text"] = text
+    return text
+
+
+def iter_jsonld(soup, prefilter=None):
+    """Yield each parsed <script type="application/ld+json"> block on a page.
+
+    Blocks are decoded lazily with orjson (via fastjson), so callers that stop
+    at the first match never parse the rest; malformed blocks are skipped.
+    prefilter is a compiled regex the raw block must match to be decoded at
+    all — a cheap way to pass over catalog/breadcrumb blocks.
+    """
+    for script in soup.select('script[type="application/ld+json"]'):
+        text = script.string
+        if not text:
+            continue
+        if prefilter is not None and not prefilter.search(text):
+            continue
+        try:
+            yield loads(text)
+        except (JSONDecodeError, TypeError):
+            continue
+
+
+@dataclass
+class EnrichResult:
+    """One module's outcome for one lead: field updates plus an optional error.
+
+    Expected failures (site down, no results) are reported here rather than
+    raised, so they reach the lead's enrichmentErrors without an exception.
+    """
+
+    data: dict = field(default_factory=dict)
+    error: str | None = None
+
 
 class BaseEnricher(ABC):
     """Abstract base class for enrichment modules."""
@@ -14,18 +135,26 @@ class BaseEnricher(ABC):
     MODULE_NAME = "base"
 
     @abstractmethod
-    def enrich(self, lead) -> dict:
+    def enrich(self, lead) -> dict | EnrichResult:
         """
         Enrich a lead with additional data.
-        Returns a dict of field names (snake_case) → values to update on the lead.
+        Returns a dict of field names (snake_case) → values to update on the lead,
+        or an EnrichResult when there is also a failure to report.
         """
         pass
 
-    def safe_enrich(self, lead) -> dict:
-        """Enrich with error handling."""
+    def run(self, lead) -> EnrichResult:
+        """Enrich with error handling; unexpected exceptions become the result's error."""
         try:
-            return self.enrich(lead)
+            result = self.enrich(lead)
         except Exception as e:
             name = getattr(lead, "businessName", getattr(lead, "business_name", "unknown"))
             logger.error(f"[{self.MODULE_NAME}] Error enriching {name}: {e}")
-            return {}
+            return EnrichResult(error=str(e))
+        if isinstance(result, EnrichResult):
+            return result
+        return EnrichResult(result or {})
+
+    def safe_enrich(self, lead) -> dict:
+        """Enrich with error handling."""
+        return self.run(lead).data
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
-from urllib.parse import quote_plus, urlparse
-
-from bs4 import BeautifulSoup
-
-from src.enrichment.base import BaseEnricher
-from src.scrapers.http_client import ScraperHttpClient
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from src.enrichment.base import (
+    GENERIC_PREFIXES, BaseEnricher, EnrichResult, find_linkedin_profile, iter_jsonld,
+    page_text,
+)
+from src.scrapers.http_client import ScraperHttpClient, normalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +29,54 @@ ABOUT_PATHS = [
     "/our-company", "/bio", "/owner", "/founders",
 ]
 
+# Result pages that are only scanned for links skip building the rest of the tree
+LINKS_ONLY = SoupStrainer("a")
+
+# Parallel about/team page probes per lead (the GETs that follow a hit are
+# still rate limited per domain)
+ABOUT_FETCH_WORKERS = 4
+
+# Characters of text scanned for owner mentions — names sit in the intro and
+# team cards near the top; the tail of long pages is mostly boilerplate
+PAGE_SCAN_CHARS = 20_000
+SNIPPET_SCAN_CHARS = 10_000
+
+# Strategy results remembered per site / search for the enricher's lifetime
+RESULT_CACHE_SIZE = 2048
+
+# Businesses where every strategy came up empty are not retried for a while.
+# Process-wide, since each enrichment run builds a fresh enricher.
+NO_OWNER_TTL_SECONDS = 7 * 24 * 3600
+NO_OWNER_MAX_ENTRIES = 50_000
+_no_owner: OrderedDict[str, float] = OrderedDict()  # key -> expiry (monotonic)
+_no_owner_lock = threading.Lock()
+
+
+def _no_owner_key(lead) -> str:
+    # Same-name businesses in one state are told apart by site, else city
+    place = normalize_url(lead.website) if lead.website else (lead.city or "").lower()
+    return f"{(lead.businessName or '').strip().lower()}|{lead.state or ''}|{place}"
+
+
+def _recently_no_owner(key: str) -> bool:
+    with _no_owner_lock:
+        expires = _no_owner.get(key)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del _no_owner[key]
+            return False
+        return True
+
+
+def _remember_no_owner(key: str):
+    with _no_owner_lock:
+        _no_owner[key] = time.monotonic() + NO_OWNER_TTL_SECONDS
+        _no_owner.move_to_end(key)
+        while len(_no_owner) > NO_OWNER_MAX_ENTRIES:
+            _no_owner.popitem(last=False)
+
+
 # Title patterns for decision makers (ranked by importance)
 DECISION_MAKER_TITLES = [
     "owner", "founder", "co-founder", "cofounder",
@@ -32,21 +87,102 @@ DECISION_MAKER_TITLES = [
     "vice president", "vp",
 ]
 
+# _person_from_jsonld only returns a node typed "Person", so blocks without
+# one (Product, BreadcrumbList, ...) aren't worth decoding
+_JSONLD_PERSON_RE = re.compile(r'"@type"\s*:\s*"person"', re.IGNORECASE)
+
+# Person-name shape: "John Smith" / "John Q. Smith"
+_NAME_RX = r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)'
+_TITLE_RX = "|".join(re.escape(t) for t in DECISION_MAKER_TITLES)
+
+# Every title in one whole-word pass (longest first so "managing partner"
+# wins over "partner"); _TITLE_RANK picks the most important hit
+_TITLE_SCAN_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(map(re.escape, DECISION_MAKER_TITLES), key=len, reverse=True)) + r")\b"
+)
+_TITLE_RANK = {title: rank for rank, title in enumerate(DECISION_MAKER_TITLES)}
+# Any title anywhere in a string (substring, like `t in s`) — one search
+# instead of a Python-level loop over every title
+_TITLE_ANY_RE = re.compile(_TITLE_RX, re.IGNORECASE)
+
+# Owner/title patterns for page text, compiled once and tried in priority order
+_OWNER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        # "John Smith, Owner" / "John Smith - Founder"
+        rf'{_NAME_RX}\s*[,\-–—|/]\s*({_TITLE_RX})',
+        # "Owner: John Smith" / "Founder — John Smith"
+        rf'({_TITLE_RX})\s*[:\-–—|/]\s*{_NAME_RX}',
+        # "Meet our Owner John Smith" / "About Founder John Smith"
+        rf'(?:meet\s+(?:our\s+)?|about\s+|by\s+)({_TITLE_RX})\s+{_NAME_RX}',
+        # "John Smith is the owner of..."
+        rf'{_NAME_RX}\s+is\s+the\s+({_TITLE_RX})',
+        # "owned by John Smith"
+        rf'(?:owned|founded|started|operated)\s+by\s+{_NAME_RX}',
+    )
+]
+
+# All owner patterns as one alternation, so page text is scanned once;
+# the named group p<i> says which pattern hit
+_OWNER_SCAN_RE = re.compile(
+    "|".join(f"(?P<p{i}>{p.pattern})" for i, p in enumerate(_OWNER_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Owner patterns for Google result snippets
+_GOOGLE_OWNER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        rf'(?:owner|founded|owned\s+by)[:\s]+{_NAME_RX}',
+        rf'{_NAME_RX}\s*[,\-–]\s*(?:owner|founder)',
+        rf'{_NAME_RX}\s+(?:is|was)\s+the\s+(?:owner|founder)',
+    )
+]
+
+# Officer/agent patterns for state registration results
+_REGISTRATION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        rf'(?:registered\s+agent|officer|director|incorporator)[:\s]+{_NAME_RX}',
+        rf'{_NAME_RX}\s*[,\-]\s*(?:registered\s+agent|officer|director)',
+    )
+]
+
+_NAME_RE = re.compile(_NAME_RX)
+_CAPITALIZED_RE = re.compile(r'[A-Z][a-z]+')
+_ALT_NAME_RE = re.compile(r'^([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s*[-,]\s*(.+))?$')
+_PERSONAL_LOCAL_RE = re.compile(r'^[a-z]+\.?[a-z]+$')
+
+# Site-builder hosts where firstname@domain wouldn't reach the owner
+# (a tuple, so one str.endswith call checks them all)
+_PLATFORM_SUFFIXES = (
+    "wixsite.com", "squarespace.com", "weebly.com",
+    "godaddysites.com", "business.site", "wordpress.com",
+    "myshopify.com", "webflow.io",
+)
+
 EMAIL_RE = re.compile(
     r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}',
     re.IGNORECASE,
 )
 
-# Generic email prefixes that are NOT personal
-GENERIC_PREFIXES = {
-    "info", "contact", "hello", "support", "admin", "sales",
-    "billing", "office", "help", "service", "team", "inquiries",
-    "general", "mail", "enquiries", "reception", "accounts",
-    "customerservice", "cs", "orders",
-}
+
+@lru_cache(maxsize=1024)
+def _domain_email_re(domain: str) -> re.Pattern:
+    """Emails at domain or one of its subdomains — far cheaper than EMAIL_RE."""
+    return re.compile(
+        rf'[a-z0-9._%+\-]+@(?:[a-z0-9\-]+\.)*{re.escape(domain)}(?![a-z0-9.\-]*[a-z0-9])',
+        re.IGNORECASE,
+    )
+
+
+def _site_domain(website: str) -> str:
+    """Host of a site URL without a leading www. — plain string ops, no urlparse."""
+    host = website.split("://", 1)[-1]
+    for sep in "/?#":
+        host = host.split(sep, 1)[0]
+    return host[4:] if host.startswith("www.") else host
+
 
 # Words that are NOT person names — US states, prepositions, common words
-_NOT_NAMES = {
+_NOT_NAMES = frozenset({
     # US state abbreviations
     "al", "ak", "az", "ar", "ca", "co", "ct", "de", "fl", "ga",
     "hi", "id", "il", "in", "ia", "ks", "ky", "la", "me", "md",
@@ -64,7 +200,7 @@ _NOT_NAMES = {
     "saint", "san", "los", "las", "new", "port", "springs",
     "beach", "lake", "palm", "cape", "coral", "bay", "city",
     "downtown", "midtown", "uptown", "central", "metro",
-}
+})
 
 # State Secretary of State / business registration search URLs
 STATE_BIZ_SEARCH = {
@@ -81,38 +217,31 @@ STATE_BIZ_SEARCH = {
 }
 
 
+# The same candidate turns up in several strategies and on several pages
+@lru_cache(maxsize=8192)
 def _is_valid_person_name(name: str) -> bool:
     """Check if a string looks like a real person's name, not a place or junk."""
     if not name or len(name) < 5:
         return False
 
-    parts = name.strip().split()
+    parts = name.split()
     if len(parts) < 2:
         return False
 
-    # Each part must be at least 2 chars (initials with period are OK, e.g. "J.")
-    for part in parts:
-        clean = part.rstrip(".")
-        if len(clean) < 2:
-            # Allow single-letter initials with period
-            if not (len(part) == 2 and part.endswith(".")):
-                return False
-
-    # Check for junk words
-    for part in parts:
-        if part.lower().rstrip(".") in _NOT_NAMES:
-            return False
-
     # Must start with uppercase
     if not parts[0][0].isupper() or not parts[-1][0].isupper():
         return False
 
-    # Reject all-caps (likely acronyms) and all-lowercase
     for part in parts:
-        if part == part.upper() and len(part) > 2:
+        # Each part must be at least 2 chars (initials with period are OK, e.g. "J.")
+        if len(part.rstrip(".")) < 2 and not (len(part) == 2 and part[1] == "."):
+            return False
+        # Reject all-caps (likely acronyms)
+        if len(part) > 2 and part == part.upper():
             return False
 
-    return True
+    # Check for junk words
+    return _NOT_NAMES.isdisjoint(part.lower().rstrip(".") for part in parts)
 
 
 class ContactEnricher(BaseEnricher):
@@ -122,35 +251,88 @@ class ContactEnricher(BaseEnricher):
 
     def __init__(self):
         self.http = ScraperHttpClient()
+        # Chain locations and re-listed businesses share a site and the same
+        # searches; their strategy results are reused instead of recomputed
+        self._results: OrderedDict[tuple, object] = OrderedDict()
+        self._results_lock = threading.Lock()
+
+    def _memoized(self, key: tuple, compute):
+        """Return the cached result for key, computing (and caching) it on a miss."""
+        with self._results_lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        value = compute()
+        with self._results_lock:
+            self._results[key] = value
+            while len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return value
+
+    def _attempt(self, label: str, key: tuple, compute, failures: list[str]):
+        """_memoized, but a raised exception is recorded in failures (and not cached)."""
+        try:
+            return self._memoized(key, compute)
+        except Exception as e:
+            logger.debug(f"[Contact] {label} failed: {e}")
+            failures.append(f"{label} failed: {e}")
+            return None
 
-    def enrich(self, lead) -> dict:
+    def enrich(self, lead) -> EnrichResult:
         result = {}
+        error = None
+        failures: list[str] = []
         name = lead.businessName or ""
 
+        # Nothing to build on and nothing found last time — skip every strategy
+        known_contact = (
+            getattr(lead, "ownerName", None) or getattr(lead, "ownerEmail", None)
+            or getattr(lead, "ownerLinkedin", None)
+        )
+        no_owner_key = _no_owner_key(lead)
+        if not known_contact and _recently_no_owner(no_owner_key):
+            return EnrichResult(result)
+
         # Strategy 1: Mine the business website for owner info
         if lead.website:
-            website_result = self._mine_website(lead)
-            result.update(website_result)
+            website_result = self._memoized(
+                ("site", normalize_url(lead.website)), lambda: self._mine_website(lead)
+            )
+            if website_result is None:
+                error = f"website unreachable: {lead.website}"
+            else:
+                result.update(website_result)
 
         # Strategy 2: Google search for "business name owner" / "business name founder"
         # Skip if google_intel already found the owner (saves a Google search)
         existing_owner = getattr(lead, "ownerName", None)
         if not result.get("owner_name") and not existing_owner:
-            google_result = self._google_owner_search(lead)
-            result.update(google_result)
+            google_result = self._attempt(
+                "google owner search", ("google", name.lower(), lead.city, lead.state),
+                lambda: self._google_owner_search(lead), failures,
+            )
+            result.update(google_result or {})
 
         # Strategy 3: Check state business registrations for registered agent/officer
         # Skip if owner already found by any prior strategy or module
         effective_owner = result.get("owner_name") or existing_owner
         if not effective_owner and lead.state:
-            reg_result = self._check_state_registration(name, lead.state)
-            result.update(reg_result)
+            reg_result = self._attempt(
+                "registry search", ("registry", name.lower(), lead.state),
+                lambda: self._check_state_registration(name, lead.state), failures,
+            )
+            result.update(reg_result or {})
 
         # Strategy 4: Search Google for LinkedIn profile
         existing_linkedin = result.get("owner_linkedin") or getattr(lead, "ownerLinkedin", None)
         if not existing_linkedin:
             owner_name_for_search = result.get("owner_name") or getattr(lead, "ownerName", None)
-            linkedin = self._find_linkedin(name, lead.city, lead.state, owner_name_for_search)
+            linkedin = self._attempt(
+                "linkedin search",
+                ("linkedin", name.lower(), lead.city, lead.state, owner_name_for_search),
+                lambda: self._find_linkedin(name, lead.city, lead.state, owner_name_for_search),
+                failures,
+            )
             if linkedin:
                 result["owner_linkedin"] = linkedin
 
@@ -185,10 +367,22 @@ class ContactEnricher(BaseEnricher):
                 f"{result.get('owner_name')} ({result.get('owner_title', 'Unknown')})"
             )
 
-        return result
+        # Only a clean miss counts; an unreachable site or a blocked search
+        # may just be a blip
+        if failures:
+            error = "; ".join([error, *failures] if error else failures)
+        if not known_contact and error is None and not any(
+            result.get(k) for k in ("owner_name", "owner_email", "owner_linkedin")
+        ):
+            _remember_no_owner(no_owner_key)
+
+        return EnrichResult(result, error)
+
+    def _mine_website(self, lead) -> dict | None:
+        """Deep mine the business website for owner/decision maker info.
 
-    def _mine_website(self, lead) -> dict:
-        """Deep mine the business website for owner/decision maker info."""
+        Returns None when the homepage can't be fetched.
+        """
         result = {}
         soups_to_check = []
 
@@ -197,22 +391,48 @@ class ContactEnricher(BaseEnricher):
             homepage = self.http.get_soup(lead.website)
             soups_to_check.append(("homepage", homepage))
         except Exception:
-            return {}
+            return None
 
-        # Find and fetch about/team pages
+        # Find and fetch about/team pages — probed in parallel, since most
+        # paths 404 and each miss would otherwise cost a full round-trip.
+        # A HEAD probe weeds out missing pages and redirects to the homepage
+        # before any body is downloaded or parsed.
         base_url = lead.website.rstrip("/")
-        for path in ABOUT_PATHS:
-            try:
-                url = base_url + path
-                soup = self.http.get_soup(url)
-                # Only keep if it's a real page (not a redirect to homepage)
-                text = soup.get_text()
-                if len(text) > 500:
-                    soups_to_check.append((path, soup))
-                    if len(soups_to_check) >= 5:
+        homepage_key = normalize_url(base_url)
+
+        def fetch_about(url: str) -> BeautifulSoup | None:
+            target = self.http.probe(url)
+            if target is None or normalize_url(target) == homepage_key:
+                return None
+            return self.http.get_soup(target)
+
+        found: list[tuple[int, str, BeautifulSoup]] = []
+        with ThreadPoolExecutor(max_workers=ABOUT_FETCH_WORKERS) as pool:
+            futures = {
+                pool.submit(fetch_about, base_url + path): i
+                for i, path in enumerate(ABOUT_PATHS)
+            }
+            for future in as_completed(futures):
+                try:
+                    soup = future.result()
+                except Exception:
+                    continue
+                if soup is None:
+                    continue
+                # Only keep if it's a real page (not a redirect to homepage
+                # or to a page already collected — those reuse the same soup)
+                if soup is homepage or any(soup is seen for _, _, seen in found):
+                    continue
+                if len(page_text(soup)) > 500:
+                    i = futures[future]
+                    found.append((i, ABOUT_PATHS[i], soup))
+                    if len(found) >= 4:
+                        for pending in futures:
+                            pending.cancel()
                         break
-            except Exception:
-                continue
+        # Check pages in ABOUT_PATHS priority order, not arrival order
+        found.sort(key=lambda item: item[0])
+        soups_to_check.extend((path, soup) for _, path, soup in found)
 
         # Check each page for owner info
         for page_name, soup in soups_to_check:
@@ -234,17 +454,16 @@ class ContactEnricher(BaseEnricher):
     def _extract_person_from_page(self, soup: BeautifulSoup) -> dict:
         """Extract person name + title from a page using multiple strategies."""
         result = {}
-        page_text = soup.get_text(separator=" ")
+        scan_text = page_text(soup)[:PAGE_SCAN_CHARS]
 
         # Strategy A: Schema.org / JSON-LD structured data (most reliable)
-        for script in soup.select('script[type="application/ld+json"]'):
+        for data in iter_jsonld(soup, prefilter=_JSONLD_PERSON_RE):
             try:
-                data = json.loads(script.string)
                 person = self._person_from_jsonld(data)
-                if person:
-                    return person
-            except (json.JSONDecodeError, TypeError, AttributeError):
+            except (TypeError, AttributeError):
                 continue
+            if person:
+                return person
 
         # Strategy B: Look for people in structured HTML elements
         # Team/about sections often use cards or list items
@@ -256,9 +475,7 @@ class ContactEnricher(BaseEnricher):
         )
         for container in person_containers:
             text = container.get_text(separator=" ")
-            name_match = re.search(
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)', text
-            )
+            name_match = _NAME_RE.search(text)
             if name_match:
                 name = name_match.group(1)
                 if _is_valid_person_name(name):
@@ -266,23 +483,15 @@ class ContactEnricher(BaseEnricher):
                     if title:
                         return {"owner_name": name, "owner_title": title.title()}
 
-        # Strategy C: Title pattern matching in page text
-        title_pattern = "|".join(re.escape(t) for t in DECISION_MAKER_TITLES)
-        patterns = [
-            # "John Smith, Owner" / "John Smith - Founder"
-            rf'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s*[,\-–—|/]\s*({title_pattern})',
-            # "Owner: John Smith" / "Founder — John Smith"
-            rf'({title_pattern})\s*[:\-–—|/]\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-            # "Meet our Owner John Smith" / "About Founder John Smith"
-            rf'(?:meet\s+(?:our\s+)?|about\s+|by\s+)({title_pattern})\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-            # "John Smith is the owner of..."
-            rf'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s+is\s+the\s+({title_pattern})',
-            # "owned by John Smith"
-            rf'(?:owned|founded|started|operated)\s+by\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # Strategy C: Title pattern matching in page text — one scan records
+        # each pattern's first hit, then they're tried in priority order
+        first_hits: dict[int, int] = {}
+        for m in _OWNER_SCAN_RE.finditer(scan_text):
+            first_hits.setdefault(int(m.lastgroup[1:]), m.start())
+            if len(first_hits) == len(_OWNER_PATTERNS):
+                break
+        for i in sorted(first_hits):
+            match = _OWNER_PATTERNS[i].match(scan_text, first_hits[i])
             if match:
                 groups = match.groups()
                 candidate_name = None
@@ -290,9 +499,7 @@ class ContactEnricher(BaseEnricher):
 
                 if len(groups) == 2:
                     g1, g2 = groups
-                    if re.match(r'[A-Z][a-z]+', g1) and not any(
-                        t in g1.lower() for t in DECISION_MAKER_TITLES
-                    ):
+                    if _CAPITALIZED_RE.match(g1) and not _TITLE_ANY_RE.search(g1):
                         candidate_name = g1.strip()
                         candidate_title = g2.strip().title()
                     else:
@@ -312,15 +519,11 @@ class ContactEnricher(BaseEnricher):
             for img in soup.select("img[alt]"):
                 alt = img.get("alt", "")
                 # Check if alt text looks like a person's name
-                name_match = re.match(
-                    r'^([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s*[-,]\s*(.+))?$', alt
-                )
+                name_match = _ALT_NAME_RE.match(alt)
                 if name_match:
                     name = name_match.group(1)
                     title = name_match.group(2) or ""
-                    if _is_valid_person_name(name) and title and any(
-                        t in title.lower() for t in DECISION_MAKER_TITLES
-                    ):
+                    if _is_valid_person_name(name) and title and _TITLE_ANY_RE.search(title):
                         result["owner_name"] = name
                         result["owner_title"] = title.strip().title()
                         break
@@ -370,24 +573,29 @@ class ContactEnricher(BaseEnricher):
         if idx < 0:
             return None
         context = text[max(0, idx - 50): idx + len(name) + 100].lower()
-        for title in DECISION_MAKER_TITLES:
-            if title in context:
-                return title
-        return None
+        titles = _TITLE_SCAN_RE.findall(context)
+        return min(titles, key=_TITLE_RANK.__getitem__) if titles else None
 
     def _find_personal_email(self, soup: BeautifulSoup, website: str) -> str | None:
         """Find a personal (non-generic) email from a page."""
-        domain = urlparse(website).netloc.replace("www.", "")
-        page_text = soup.get_text(separator=" ")
-        emails = EMAIL_RE.findall(page_text)
+        domain = _site_domain(website)
+
+        # mailto: links first — that's where small-business sites put them
+        mailtos = (
+            a.get("href", "").replace("mailto:", "").split("?")[0].strip()
+            for a in soup.select('a[href^="mailto:"]')
+        )
+        email = self._first_personal_email(filter(None, mailtos), domain)
+        if email:
+            return email
 
-        # Also check mailto links
-        for a in soup.select('a[href^="mailto:"]'):
-            href = a.get("href", "")
-            email = href.replace("mailto:", "").split("?")[0].strip()
-            if email:
-                emails.append(email)
+        # Only then scan the page text, for this domain's addresses alone
+        email_re = _domain_email_re(domain.lower()) if domain else EMAIL_RE
+        return self._first_personal_email(email_re.findall(page_text(soup)), domain)
 
+    @staticmethod
+    def _first_personal_email(emails, domain: str) -> str | None:
+        """First name-like, non-generic address at the business domain."""
         for email in emails:
             email = email.lower()
             local = email.split("@")[0]
@@ -399,7 +607,7 @@ class ContactEnricher(BaseEnricher):
             # Prefer emails from the business domain
             if domain in email_domain:
                 # Check if it looks personal (has a name-like prefix)
-                if re.match(r'^[a-z]+\.?[a-z]+$', local) and len(local) > 2:
+                if _PERSONAL_LOCAL_RE.match(local) and len(local) > 2:
                     return email
 
         return None
@@ -418,30 +626,21 @@ class ContactEnricher(BaseEnricher):
             f'"{name}" owner OR founder {city} {state}',
         ]
 
+        # Fetch errors propagate, so enrich() can tell a miss from a failure
         for query in queries:
-            try:
-                url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
-                soup = self.http.get_soup(url)
-                text = soup.get_text(separator=" ")
-
-                # Look for "Owner: Name" or "Name, Owner" patterns in Google snippets
-                patterns = [
-                    rf'(?:owner|founded|owned\s+by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-                    rf'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s*[,\-–]\s*(?:owner|founder)',
-                    rf'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s+(?:is|was)\s+the\s+(?:owner|founder)',
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        owner_name = match.group(1).strip()
-                        if _is_valid_person_name(owner_name):
-                            return {
-                                "owner_name": owner_name,
-                                "owner_title": "Owner",
-                            }
-            except Exception:
-                continue
+            url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
+            text = self.http.get_text(url)[:SNIPPET_SCAN_CHARS]
+
+            # Look for "Owner: Name" or "Name, Owner" patterns in Google snippets
+            for pattern in _GOOGLE_OWNER_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    owner_name = match.group(1).strip()
+                    if _is_valid_person_name(owner_name):
+                        return {
+                            "owner_name": owner_name,
+                            "owner_title": "Owner",
+                        }
 
         return {}
 
@@ -453,27 +652,19 @@ class ContactEnricher(BaseEnricher):
         query = f"{business_name} {state} business registration officer"
         url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
 
-        try:
-            soup = self.http.get_soup(url)
-            text = soup.get_text(separator=" ")
-
-            # Look for officer/agent patterns
-            patterns = [
-                r'(?:registered\s+agent|officer|director|incorporator)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s*[,\-]\s*(?:registered\s+agent|officer|director)',
-            ]
+        # Fetch errors propagate, so enrich() can tell a miss from a failure
+        text = self.http.get_text(url)[:SNIPPET_SCAN_CHARS]
 
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    name = match.group(1).strip()
-                    if _is_valid_person_name(name):
-                        return {
-                            "owner_name": name,
-                            "owner_title": "Owner",
-                        }
-        except Exception:
-            pass
+        # Look for officer/agent patterns
+        for pattern in _REGISTRATION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                name = match.group(1).strip()
+                if _is_valid_person_name(name):
+                    return {
+                        "owner_name": name,
+                        "owner_title": "Owner",
+                    }
 
         return {}
 
@@ -489,38 +680,19 @@ class ContactEnricher(BaseEnricher):
 
         url = f"https://www.google.com/search?q={quote_plus(query)}&num=5"
 
-        try:
-            soup = self.http.get_soup(url)
-            for a in soup.select("a[href]"):
-                href = a.get("href", "")
-                if "linkedin.com/in/" in href:
-                    # Extract clean LinkedIn URL
-                    if href.startswith("/url?q="):
-                        href = href.split("/url?q=")[1].split("&")[0]
-                    parsed = urlparse(href)
-                    if "/in/" in parsed.path:
-                        clean = f"https://www.linkedin.com{parsed.path}".rstrip("/")
-                        return clean
-        except Exception:
-            pass
-
-        return None
+        # Fetch errors propagate, so enrich() can tell a miss from a failure
+        soup = self.http.get_soup(url, parse_only=LINKS_ONLY)
+        return find_linkedin_profile(soup)
 
     def _generate_personal_email(self, owner_name: str, website: str) -> str | None:
         """Generate likely personal email from owner name + business domain."""
-        parsed = urlparse(website)
-        domain = parsed.netloc.replace("www.", "")
+        domain = _site_domain(website)
 
         if not domain or "." not in domain:
             return None
 
         # Skip platform domains
-        platform_domains = {
-            "wixsite.com", "squarespace.com", "weebly.com",
-            "godaddysites.com", "business.site", "wordpress.com",
-            "myshopify.com", "webflow.io",
-        }
-        if any(p in domain for p in platform_domains):
+        if domain.lower().endswith(_PLATFORM_SUFFIXES):
             return None
 
         # Parse name parts
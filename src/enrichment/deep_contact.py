@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import logging
 import re
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, urlsplit
 
 from bs4 import BeautifulSoup
 
-from src.enrichment.base import BaseEnricher
+from src.enrichment.base import BaseEnricher, is_junk_email_domain, iter_jsonld, page_text
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
@@ -23,10 +24,9 @@ PRIORITY_PATHS = [
     "/footer", "/sitemap",
 ]
 
-# Email regex
+# Email regex (classes already cover both cases, so no IGNORECASE)
 EMAIL_RE = re.compile(
-    r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}',
-    re.IGNORECASE,
+    r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}'
 )
 
 # Phone regex (US formats)
@@ -41,25 +41,36 @@ OBFUSCATED_EMAIL_RE = re.compile(
     r'([a-zA-Z]{2,})',
 )
 
-# Junk emails to ignore
-JUNK_EMAIL_DOMAINS = {
-    "example.com", "domain.com", "email.com", "test.com",
-    "sentry.io", "wixpress.com", "wordpress.com",
-    "squarespace.com", "godaddy.com", "weebly.com", "wix.com",
-    "shopify.com", "googleapis.com", "gravatar.com", "w3.org",
-    "schema.org", "facebook.com", "twitter.com", "instagram.com",
-    "cloudflare.com", "google.com", "google.de", "google.co.uk",
-    "google.ca", "google.com.au", "google.co.in",
-    "gstatic.com", "jquery.com",
-    "bootstrapcdn.com", "jsdelivr.net", "unpkg.com", "cdnjs.com",
-    "fontawesome.com", "sonsio.com", "shell.com",
-}
-
-JUNK_EMAIL_PREFIXES = {
+# Emails, phones and obfuscated emails in one alternation, so page text is
+# scanned once; lastgroup says which kind matched
+CONTACT_SCAN_RE = re.compile(
+    f"(?P<email>{EMAIL_RE.pattern})|(?P<phone>{PHONE_RE.pattern})"
+    f"|(?P<obfuscated>{OBFUSCATED_EMAIL_RE.pattern})"
+)
+
+# Email split across JS string literals: "user" + "@" + "domain.com"
+JS_CONCAT_EMAIL_RE = re.compile(
+    r'''["']([a-zA-Z0-9._%+-]+)["']\s*\+\s*["']@["']\s*\+\s*["']([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})["']'''
+)
+
+NON_DIGIT_RE = re.compile(r"[^\d]")
+
+# System mailboxes that never reach a person
+JUNK_EMAIL_PREFIXES = frozenset({
     "noreply", "no-reply", "donotreply", "do-not-reply",
     "mailer-daemon", "postmaster", "webmaster", "hostmaster",
     "abuse", "test", "null", "devnull", "root", "user",
-}
+})
+
+# Link targets that are files, not pages worth crawling
+ASSET_EXTENSIONS = frozenset({"pdf", "jpg", "jpeg", "png", "gif", "svg", "css", "js", "mp4", "mp3", "zip"})
+
+# hrefs that never lead to another page on the site
+NON_PAGE_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:")
+
+# Threads fetching priority pages, shared by every lead this enricher handles
+# (the pipeline enriches several leads at once)
+PAGE_FETCH_WORKERS = 8
 
 
 class DeepContactEnricher(BaseEnricher):
@@ -69,6 +80,7 @@ class DeepContactEnricher(BaseEnricher):
 
     def __init__(self):
         self.http = ScraperHttpClient()
+        self._pool = ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS)
 
     def enrich(self, lead) -> dict:
         if not lead.website:
@@ -105,26 +117,28 @@ class DeepContactEnricher(BaseEnricher):
 
         internal_links.sort(key=link_priority)
 
-        for link_url in internal_links[:max_pages]:
+        # Fetch the priority pages concurrently, then read them in priority order
+        futures = [self._pool.submit(self.http.get_soup, url) for url in internal_links[:max_pages]]
+        for future in futures:
             try:
-                soup = self.http.get_soup(link_url)
+                soup = future.result()
                 self._extract_from_page(soup, all_emails, all_phones)
                 pages_crawled += 1
-                # Early exit: stop crawling once we have enough data
-                if len(all_emails) >= 2 and len(all_phones) >= 1:
-                    break
             except Exception:
                 continue
-
-        # Step 3: Check for obfuscated emails on homepage
-        if homepage_soup:
-            self._extract_obfuscated_emails(homepage_soup, all_emails)
-
-        # Step 4: Check for JavaScript-rendered email (common anti-scrape)
+            # Early exit: stop reading once we have enough data. Fetches not yet
+            # started are dropped; ones already in flight finish in the
+            # background (their soups still land in the shared cache).
+            if len(all_emails) >= 2 and len(all_phones) >= 1:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+        # Step 3: Check for JavaScript-rendered email (common anti-scrape)
         if homepage_soup:
             self._extract_js_emails(homepage_soup, all_emails)
 
-        # Step 5: Process results
+        # Step 4: Process results
         clean_emails = self._filter_emails(all_emails, base_domain)
         clean_phones = self._filter_phones(all_phones, lead.phone)
 
@@ -156,22 +170,21 @@ class DeepContactEnricher(BaseEnricher):
     ) -> list[str]:
         """Find all internal links on the page."""
         links = set()
-        for a in soup.select("a[href]"):
-            href = a.get("href", "").strip()
-            if not href or href.startswith("#") or href.startswith("javascript:"):
+        site = base_domain.replace("www.", "")
+        for a in soup.find_all("a", href=True):
+            href = a["href"].strip()
+            if not href or href.startswith(NON_PAGE_HREF_PREFIXES):
                 continue
 
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
-            parsed = urlparse(full_url)
+            # Resolve relative URLs (urlsplit: no ;params parsing needed)
+            parsed = urlsplit(urljoin(base_url, href))
 
             # Only follow internal links
-            if parsed.netloc.lower().replace("www.", "") != base_domain.replace("www.", ""):
+            if parsed.netloc.lower().replace("www.", "") != site:
                 continue
 
             # Skip media/assets
-            ext = parsed.path.split(".")[-1].lower() if "." in parsed.path else ""
-            if ext in ("pdf", "jpg", "jpeg", "png", "gif", "svg", "css", "js", "mp4", "mp3", "zip"):
+            if "." in parsed.path and parsed.path.rpartition(".")[2].lower() in ASSET_EXTENSIONS:
                 continue
 
             clean = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
@@ -185,48 +198,44 @@ class DeepContactEnricher(BaseEnricher):
         self, soup: BeautifulSoup, emails: set, phones: set
     ) -> None:
         """Extract emails and phones from a page."""
-        page_text = soup.get_text(separator=" ")
-
-        # Emails from text
-        for email in EMAIL_RE.findall(page_text):
-            emails.add(email.lower())
-
-        # Emails from mailto: links
-        for a in soup.select('a[href^="mailto:"]'):
-            href = a.get("href", "")
-            email = href.replace("mailto:", "").split("?")[0].strip()
-            if email:
-                emails.add(email.lower())
+        # Emails, phones and obfuscated emails from text
+        for match in CONTACT_SCAN_RE.finditer(page_text(soup)):
+            kind = match.lastgroup
+            if kind == "email":
+                emails.add(match.group().lower())
+            elif kind == "phone":
+                phones.add(match.group().strip())
+            else:
+                user, domain, tld = OBFUSCATED_EMAIL_RE.match(match.group()).groups()
+                emails.add(f"{user}@{domain}.{tld}".lower())
+
+        # mailto:/tel: links and meta tags, collected in one walk of the tree
+        # rather than a separate CSS select per kind
+        for tag in soup.find_all(("a", "meta")):
+            if tag.name == "a":
+                href = tag.get("href", "")
+                if href.startswith("mailto:"):
+                    email = href.replace("mailto:", "").split("?")[0].strip()
+                    if email:
+                        emails.add(email.lower())
+                elif href.startswith("tel:"):
+                    phone = href.replace("tel:", "").replace("+1", "").strip()
+                    phone = NON_DIGIT_RE.sub("", phone)
+                    if len(phone) == 10:
+                        phones.add(phone)
+                continue
 
-        # Phones from text
-        for phone in PHONE_RE.findall(page_text):
-            phones.add(phone.strip())
-
-        # Phones from tel: links
-        for a in soup.select('a[href^="tel:"]'):
-            href = a.get("href", "")
-            phone = href.replace("tel:", "").replace("+1", "").strip()
-            phone = re.sub(r"[^\d]", "", phone)
-            if len(phone) == 10:
-                phones.add(phone)
-
-        # Check meta tags for contact info
-        for meta in soup.select("meta"):
-            content = meta.get("content", "")
-            name = meta.get("name", "").lower()
+            # Check meta tags for contact info
+            content = tag.get("content", "")
+            name = tag.get("name", "").lower()
             if name in ("email", "contact-email"):
                 emails.add(content.lower())
             for email in EMAIL_RE.findall(content):
                 emails.add(email.lower())
 
         # Check schema.org / JSON-LD
-        import json
-        for script in soup.select('script[type="application/ld+json"]'):
-            try:
-                data = json.loads(script.string)
-                self._extract_from_jsonld(data, emails, phones)
-            except (json.JSONDecodeError, TypeError, AttributeError):
-                continue
+        for data in iter_jsonld(soup):
+            self._extract_from_jsonld(data, emails, phones)
 
     def _extract_from_jsonld(self, data, emails: set, phones: set) -> None:
         """Recursively extract emails/phones from JSON-LD structured data."""
@@ -237,7 +246,7 @@ class DeepContactEnricher(BaseEnricher):
                     if "email" in key_lower and "@" in value:
                         emails.add(value.lower())
                     elif "phone" in key_lower or "telephone" in key_lower:
-                        clean = re.sub(r"[^\d]", "", value)
+                        clean = NON_DIGIT_RE.sub("", value)
                         if len(clean) >= 10:
                             phones.add(clean[-10:])
                 elif isinstance(value, (dict, list)):
@@ -246,22 +255,16 @@ class DeepContactEnricher(BaseEnricher):
             for item in data:
                 self._extract_from_jsonld(item, emails, phones)
 
-    def _extract_obfuscated_emails(self, soup: BeautifulSoup, emails: set) -> None:
-        """Find emails that are obfuscated like 'info [at] company [dot] com'."""
-        page_text = soup.get_text(separator=" ")
-        for match in OBFUSCATED_EMAIL_RE.finditer(page_text):
-            email = f"{match.group(1)}@{match.group(2)}.{match.group(3)}".lower()
-            emails.add(email)
-
     def _extract_js_emails(self, soup: BeautifulSoup, emails: set) -> None:
         """Extract emails that are split across JavaScript variables."""
-        for script in soup.select("script:not([src])"):
+        for script in soup.find_all("script", src=False):
             text = script.string or ""
+            # Both patterns need an "@" — most inline scripts (analytics,
+            # bundles) have none and are skipped without a regex scan
+            if "@" not in text:
+                continue
             # Look for patterns like: var email = "user" + "@" + "domain.com"
-            concat_pattern = re.compile(
-                r'''["']([a-zA-Z0-9._%+-]+)["']\s*\+\s*["']@["']\s*\+\s*["']([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})["']'''
-            )
-            for match in concat_pattern.finditer(text):
+            for match in JS_CONCAT_EMAIL_RE.finditer(text):
                 email = f"{match.group(1)}@{match.group(2)}".lower()
                 emails.add(email)
 
@@ -278,7 +281,7 @@ class DeepContactEnricher(BaseEnricher):
             if not local or not domain:
                 continue
             # Skip junk domains (including all google.* country domains)
-            if domain in JUNK_EMAIL_DOMAINS or domain.startswith("google.") or ".google." in domain:
+            if is_junk_email_domain(domain):
                 continue
             # Skip junk prefixes
             if local in JUNK_EMAIL_PREFIXES:
@@ -311,11 +314,11 @@ class DeepContactEnricher(BaseEnricher):
 
     def _filter_phones(self, phones: set, existing_phone: str | None) -> list[str]:
         """Filter and deduplicate phone numbers."""
-        existing_digits = re.sub(r"[^\d]", "", existing_phone or "")
+        existing_digits = NON_DIGIT_RE.sub("", existing_phone or "")
         result = []
         seen = set()
         for phone in phones:
-            digits = re.sub(r"[^\d]", "", phone)
+            digits = NON_DIGIT_RE.sub("", phone)
             # Normalize to 10 digits
             if len(digits) == 11 and digits.startswith("1"):
                 digits = digits[1:]
@@ -345,4 +348,5 @@ class DeepContactEnricher(BaseEnricher):
         return business, owner
 
     def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
         self.http.close()
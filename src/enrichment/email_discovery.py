@@ -11,7 +11,7 @@ import logging
 import re
 from urllib.parse import quote_plus, urlparse
 
-from src.enrichment.base import BaseEnricher
+from src.enrichment.base import GENERIC_PREFIXES, BaseEnricher, is_junk_email_domain, page_text
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
@@ -21,34 +21,13 @@ EMAIL_RE = re.compile(
     re.IGNORECASE,
 )
 
-JUNK_DOMAINS = {
-    "example.com", "domain.com", "email.com", "test.com",
-    "sentry.io", "wixpress.com", "wordpress.com",
-    "squarespace.com", "w3.org", "schema.org", "googleapis.com",
-    "google.com", "google.de", "google.co.uk", "google.ca",
-    "google.com.au", "google.co.in",
-    "facebook.com", "twitter.com", "gstatic.com",
-    "sonsio.com", "shell.com",
-    "yelp.com", "bbb.org", "yellowpages.com",
-}
-
-# Generic prefixes we deprioritize — we want real people's emails
-GENERIC_PREFIXES = {
-    "info", "contact", "hello", "support", "admin", "sales",
-    "billing", "office", "help", "service", "team", "inquiries",
-    "general", "mail", "enquiries", "reception", "accounts",
-    "customerservice", "cs", "orders", "noreply", "no-reply",
-}
-
-
-def _is_junk_email_domain(domain: str) -> bool:
-    """Check if an email domain is junk (Google, social media, platform, etc)."""
-    if domain in JUNK_DOMAINS:
-        return True
-    # Catch all Google country domains (google.de, google.fr, google.co.uk, etc)
-    if domain.startswith("google.") or ".google." in domain:
-        return True
-    return False
+# Site-builder hosts where name-based addresses aren't the owner's
+PLATFORM_DOMAINS = (
+    "wixsite.com", "squarespace.com", "weebly.com",
+    "godaddysites.com", "business.site", "wordpress.com",
+    "myshopify.com", "webflow.io", "carrd.co",
+)
+PLATFORM_DOMAIN_RE = re.compile("|".join(map(re.escape, PLATFORM_DOMAINS)))
 
 
 def _is_personal_email(email: str) -> bool:
@@ -124,19 +103,18 @@ class EmailDiscoveryEnricher(BaseEnricher):
         url = f"https://www.google.com/search?q={quote_plus(search_query)}&num=10"
 
         try:
-            soup = self.http.get_soup(url)
+            page_text = self.http.get_text(url)
         except Exception as e:
             logger.debug(f"[EmailDiscovery] Google search failed: {e}")
             return None
 
-        page_text = soup.get_text(separator=" ")
         emails = EMAIL_RE.findall(page_text)
 
         # Return first valid email (personal emails rise to top naturally from Google)
         for email in emails:
             email = email.lower()
             domain = email.split("@")[1] if "@" in email else ""
-            if not _is_junk_email_domain(domain) and len(email) < 50:
+            if not is_junk_email_domain(domain) and len(email) < 50:
                 return email
 
         return None
@@ -151,9 +129,8 @@ class EmailDiscoveryEnricher(BaseEnricher):
         except Exception:
             return personal, generic
 
-        # Gather emails from page text
-        page_text = soup.get_text(separator=" ")
-        all_emails = EMAIL_RE.findall(page_text)
+        # page_text is cached on the soup and shared with the other modules
+        all_emails = EMAIL_RE.findall(page_text(soup))
 
         # Also check mailto links
         for a in soup.select('a[href^="mailto:"]'):
@@ -173,7 +150,7 @@ class EmailDiscoveryEnricher(BaseEnricher):
             seen.add(email)
 
             domain = email.split("@")[1] if "@" in email else ""
-            if _is_junk_email_domain(domain):
+            if is_junk_email_domain(domain):
                 continue
             if len(email) > 50:
                 continue
@@ -200,12 +177,7 @@ class EmailDiscoveryEnricher(BaseEnricher):
             return None
 
         # Skip platform domains
-        platform_domains = {
-            "wixsite.com", "squarespace.com", "weebly.com",
-            "godaddysites.com", "business.site", "wordpress.com",
-            "myshopify.com", "webflow.io", "carrd.co",
-        }
-        if any(platform in domain for platform in platform_domains):
+        if PLATFORM_DOMAIN_RE.search(domain):
             return None
 
         # Search for any personal email at this domain
@@ -213,9 +185,7 @@ class EmailDiscoveryEnricher(BaseEnricher):
         url = f"https://www.google.com/search?q={quote_plus(search_query)}&num=10"
 
         try:
-            soup = self.http.get_soup(url)
-            page_text = soup.get_text(separator=" ")
-            emails = EMAIL_RE.findall(page_text)
+            emails = EMAIL_RE.findall(self.http.get_text(url))
 
             for email in emails:
                 email = email.lower()
@@ -249,7 +219,7 @@ class EmailDiscoveryEnricher(BaseEnricher):
                         emails = EMAIL_RE.findall(page_text)
                         for email in emails:
                             domain = email.split("@")[1].lower()
-                            if domain not in JUNK_DOMAINS and "manta" not in domain:
+                            if not is_junk_email_domain(domain) and "manta" not in domain:
                                 return email.lower()
                     except Exception:
                         pass
@@ -11,19 +11,25 @@ Returns a verification status: "valid", "invalid", "catch_all", "unknown"
 from __future__ import annotations
 
 import re
+import time
 import socket
 import logging
 import smtplib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from pathlib import Path
 
 import dns.resolver
 
+from src.config import MX_CACHE_FILE, MX_CACHE_TTL
 from src.enrichment.base import BaseEnricher
 
 logger = logging.getLogger(__name__)
 
 # Domains where SMTP verification is unreliable (catch-all or blocks probes)
-SKIP_SMTP_DOMAINS = {
+SKIP_SMTP_DOMAINS = frozenset({
     "gmail.com", "googlemail.com",
     "yahoo.com", "yahoo.co.uk", "ymail.com",
     "outlook.com", "hotmail.com", "live.com", "msn.com",
@@ -31,15 +37,18 @@ SKIP_SMTP_DOMAINS = {
     "icloud.com", "me.com", "mac.com",
     "protonmail.com", "proton.me",
     "zoho.com",
-}
+})
 
 # Common disposable/throwaway email domains
-DISPOSABLE_DOMAINS = {
+DISPOSABLE_DOMAINS = frozenset({
     "mailinator.com", "guerrillamail.com", "tempmail.com", "throwaway.email",
     "yopmail.com", "sharklasers.com", "guerrillamailblock.com",
     "grr.la", "dispostable.com", "tempr.email", "10minutemail.com",
     "trashmail.com", "fakeinbox.com", "maildrop.cc",
-}
+})
+
+# Concurrent SMTP sessions per batch (one per MX host)
+SMTP_WORKERS = 4
 
 EMAIL_REGEX = re.compile(
     r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$"
@@ -54,20 +63,23 @@ class EmailVerificationEnricher(BaseEnricher):
     def enrich(self, lead) -> dict:
         """Verify the lead's email and owner_email. Return verification results."""
         result = {}
+        email = getattr(lead, "email", None)
+        owner_email = getattr(lead, "ownerEmail", None)
+
+        # Both addresses usually share a domain — verified in one SMTP session
+        statuses = verify_emails([e for e in (email, owner_email) if e])
 
         # Verify main email
-        email = getattr(lead, "email", None)
         if email:
-            status = verify_email(email)
+            status = statuses[email]
             if status == "invalid":
                 logger.info(f"[email_verify] Invalid email removed: {email}")
                 result["email"] = None  # Remove invalid email
             result["email_verified"] = status in ("valid", "catch_all")
 
         # Verify owner email
-        owner_email = getattr(lead, "ownerEmail", None)
         if owner_email:
-            status = verify_email(owner_email)
+            status = statuses[owner_email]
             if status == "invalid":
                 logger.info(f"[email_verify] Invalid owner email removed: {owner_email}")
                 result["owner_email"] = None
@@ -88,104 +100,229 @@ def verify_email(email: str) -> str:
     """
     if not email:
         return "invalid"
+    return verify_emails([email])[email]
+
+
+def verify_emails(emails: list[str]) -> dict[str, str]:
+    """
+    Verify several addresses; returns {email as given: status}.
+
+    Addresses are grouped by MX host so each host gets a single SMTP session
+    (one HELO/MAIL FROM, then a RCPT TO per address). The enricher passes one
+    lead's addresses, which almost always share a host; sessions for distinct
+    hosts run concurrently.
+    """
+    results: dict[str, str] = {}
+    by_mx: dict[str, list[tuple[str, str]]] = {}
+    for original in emails:
+        email, status, mx_hosts = _check_before_smtp(original)
+        if status is not None:
+            results[original] = status
+        else:
+            by_mx.setdefault(mx_hosts[0], []).append((original, email))
+
+    def _verify_group(item):
+        mx_host, group = item
+        return group, _smtp_verify(mx_host, [email for _, email in group])
+
+    if len(by_mx) == 1:
+        # The usual case — no pool for a single session
+        batches = map(_verify_group, by_mx.items())
+    elif by_mx:
+        with ThreadPoolExecutor(max_workers=min(SMTP_WORKERS, len(by_mx))) as pool:
+            batches = list(pool.map(_verify_group, by_mx.items()))
+    else:
+        batches = ()
+    for group, statuses in batches:
+        for original, email in group:
+            results[original] = statuses[email]
+
+    return results
+
+
+def _check_before_smtp(email: str | None) -> tuple[str, str | None, tuple | None]:
+    """Syntax, disposable, MX and provider checks.
+
+    Returns (normalized email, status, MX hosts); status is None when the
+    address still needs an SMTP probe.
+    """
+    if not email:
+        return "", "invalid", None
 
     email = email.strip().lower()
 
     # Layer 1: Syntax check
     if not EMAIL_REGEX.match(email):
         logger.debug(f"[email_verify] Syntax invalid: {email}")
-        return "invalid"
+        return email, "invalid", None
 
     domain = email.split("@")[1]
 
     # Check for disposable domains
     if domain in DISPOSABLE_DOMAINS:
         logger.debug(f"[email_verify] Disposable domain: {domain}")
-        return "invalid"
+        return email, "invalid", None
 
     # Layer 2: MX record lookup
     mx_hosts = _get_mx_records(domain)
     if mx_hosts is None:
         logger.debug(f"[email_verify] No MX records for {domain}")
-        return "invalid"
+        return email, "invalid", None
 
     # Layer 3: SMTP probe (skip for big providers where it's unreliable)
     if domain in SKIP_SMTP_DOMAINS:
         logger.debug(f"[email_verify] Skipping SMTP for {domain} (unreliable)")
-        return "catch_all"
+        return email, "catch_all", None
 
-    return _smtp_verify(email, mx_hosts)
+    return email, None, mx_hosts
 
 
-@lru_cache(maxsize=500)
+@lru_cache(maxsize=4096)
 def _get_mx_records(domain: str) -> tuple | None:
-    """Look up MX records for a domain. Returns sorted tuple of hostnames or None."""
+    """Look up MX records for a domain. Returns sorted tuple of hostnames or None.
+
+    Answers are kept in the on-disk cache for MX_CACHE_TTL, so restarts and
+    other worker processes skip DNS for domains already seen.
+    """
+    cached = _mx_cache_get(domain)
+    if cached is not _MISS:
+        return cached
+    hosts, definitive = _resolve_mx(domain)
+    if definitive:
+        _mx_cache_put(domain, hosts)
+    return hosts
+
+
+def _resolve_mx(domain: str) -> tuple[tuple | None, bool]:
+    """DNS MX lookup; the flag is False for failures that may be transient."""
     try:
         answers = dns.resolver.resolve(domain, "MX")
         hosts = sorted(
             [(r.preference, str(r.exchange).rstrip(".")) for r in answers],
             key=lambda x: x[0],
         )
-        return tuple(h[1] for h in hosts) if hosts else None
+        return (tuple(h[1] for h in hosts) if hosts else None), True
     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-        return None
+        return None, True
     except dns.resolver.NoNameservers:
-        return None
+        return None, False
     except dns.resolver.LifetimeTimeout:
         # DNS timeout — domain might exist but slow
-        return None
+        return None, False
     except Exception as e:
         logger.debug(f"[email_verify] MX lookup error for {domain}: {e}")
-        return None
+        return None, False
+
+
+# On-disk MX cache — one SQLite connection per process, shared by threads
+_MISS = object()
+_mx_db: sqlite3.Connection | None = None
+_mx_db_opened = False
+_mx_db_lock = threading.Lock()
+
+
+def _mx_cache_db() -> sqlite3.Connection | None:
+    """Open the MX cache on first use; None when disabled or unavailable."""
+    global _mx_db, _mx_db_opened
+    if not _mx_db_opened:
+        _mx_db_opened = True
+        if MX_CACHE_FILE:
+            try:
+                path = Path(MX_CACHE_FILE)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS mx_cache ("
+                    "domain TEXT PRIMARY KEY, hosts TEXT, fetched_at REAL NOT NULL)"
+                )
+                _mx_db = db
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"[email_verify] MX cache unavailable at {MX_CACHE_FILE}: {e}")
+    return _mx_db
+
+
+def _mx_cache_get(domain: str):
+    """Cached MX hosts (None for a domain with no MX), or _MISS."""
+    with _mx_db_lock:
+        db = _mx_cache_db()
+        if db is None:
+            return _MISS
+        try:
+            row = db.execute(
+                "SELECT hosts FROM mx_cache WHERE domain = ? AND fetched_at > ?",
+                (domain, time.time() - MX_CACHE_TTL),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"[email_verify] MX cache read failed for {domain}: {e}")
+            return _MISS
+    if row is None:
+        return _MISS
+    return tuple(row[0].split()) if row[0] else None
+
+
+def _mx_cache_put(domain: str, hosts: tuple | None) -> None:
+    with _mx_db_lock:
+        db = _mx_cache_db()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO mx_cache (domain, hosts, fetched_at) VALUES (?, ?, ?)",
+                (domain, " ".join(hosts) if hosts else None, time.time()),
+            )
+        except sqlite3.Error as e:
+            logger.debug(f"[email_verify] MX cache write failed for {domain}: {e}")
 
 
-def _smtp_verify(email: str, mx_hosts: tuple) -> str:
+def _smtp_verify(mx_host: str, emails: list[str]) -> dict[str, str]:
     """
-    Probe SMTP server to check if mailbox exists.
+    Probe an SMTP server to check which mailboxes exist.
 
-    Connects to the MX server, sends HELO/MAIL FROM/RCPT TO,
-    and checks the response code.
+    Connects to the MX server, sends HELO/MAIL FROM once, then RCPT TO for
+    each address and checks the response codes. Addresses not reached
+    (connection dropped, timeout) stay "unknown".
     """
-    # Try up to 2 MX hosts
-    for mx_host in mx_hosts[:1]:
-        try:
-            smtp = smtplib.SMTP(timeout=5)
-            smtp.connect(mx_host, 25)
-            smtp.helo("mail.verify.local")
+    statuses = dict.fromkeys(emails, "unknown")
+    smtp = smtplib.SMTP(timeout=5)
+    try:
+        smtp.connect(mx_host, 25)
+        smtp.helo("mail.verify.local")
 
-            # Use a neutral sender address
-            smtp.mail("verify@verify.local")
+        # Use a neutral sender address
+        smtp.mail("verify@verify.local")
 
+        for email in statuses:
             code, message = smtp.rcpt(email)
-            smtp.quit()
-
-            if code == 250:
-                return "valid"
-            elif code == 550:
-                return "invalid"
-            elif code in (450, 451, 452):
-                # Temporary error — could be greylisting
-                return "unknown"
-            else:
-                # 252 = cannot VRFY but will accept, likely catch-all
-                if code == 252:
-                    return "catch_all"
-                return "unknown"
-
-        except smtplib.SMTPServerDisconnected:
-            logger.debug(f"[email_verify] SMTP disconnected by {mx_host}")
-            continue
-        except smtplib.SMTPConnectError:
-            logger.debug(f"[email_verify] SMTP connect failed to {mx_host}")
-            continue
-        except socket.timeout:
-            logger.debug(f"[email_verify] SMTP timeout to {mx_host}")
-            continue
-        except OSError as e:
-            logger.debug(f"[email_verify] SMTP OS error to {mx_host}: {e}")
-            continue
-        except Exception as e:
-            logger.debug(f"[email_verify] SMTP error to {mx_host}: {e}")
-            continue
+            statuses[email] = _rcpt_status(code)
+        smtp.quit()
+
+    except smtplib.SMTPServerDisconnected:
+        logger.debug(f"[email_verify] SMTP disconnected by {mx_host}")
+    except smtplib.SMTPConnectError:
+        logger.debug(f"[email_verify] SMTP connect failed to {mx_host}")
+    except socket.timeout:
+        logger.debug(f"[email_verify] SMTP timeout to {mx_host}")
+    except OSError as e:
+        logger.debug(f"[email_verify] SMTP OS error to {mx_host}: {e}")
+    except Exception as e:
+        logger.debug(f"[email_verify] SMTP error to {mx_host}: {e}")
+    finally:
+        smtp.close()
+
+    return statuses
 
+
+def _rcpt_status(code: int) -> str:
+    """Map a RCPT TO reply code to a verification status."""
+    if code == 250:
+        return "valid"
+    elif code == 550:
+        return "invalid"
+    elif code in (450, 451, 452):
+        # Temporary error — could be greylisting
+        return "unknown"
+    # 252 = cannot VRFY but will accept, likely catch-all
+    if code == 252:
+        return "catch_all"
     return "unknown"
@@ -13,7 +13,9 @@ import logging
 import re
 from urllib.parse import quote_plus, urlparse
 
-from src.enrichment.base import BaseEnricher
+from src.enrichment.base import (
+    GENERIC_PREFIXES, BaseEnricher, find_linkedin_profile, is_junk_email_domain,
+)
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
@@ -42,24 +44,6 @@ EXCLUDED_DOMAINS = {
     "pinterest.com", "reddit.com",
 }
 
-# Junk email domains
-JUNK_EMAIL_DOMAINS = {
-    "example.com", "domain.com", "email.com", "test.com",
-    "sentry.io", "wixpress.com", "wordpress.com",
-    "squarespace.com", "w3.org", "schema.org", "googleapis.com",
-    "google.com", "google.de", "google.co.uk", "google.ca",
-    "google.com.au", "google.co.in",
-    "facebook.com", "twitter.com", "gstatic.com",
-    "yelp.com", "bbb.org", "yellowpages.com",
-}
-
-# Generic email prefixes
-GENERIC_PREFIXES = {
-    "info", "contact", "hello", "support", "admin", "sales",
-    "billing", "office", "help", "service", "team", "noreply",
-    "no-reply", "webmaster",
-}
-
 # Owner title patterns
 DECISION_MAKER_TITLES = [
     "owner", "founder", "co-founder", "cofounder",
@@ -67,6 +51,29 @@ DECISION_MAKER_TITLES = [
     "principal", "proprietor", "partner",
 ]
 
+_TITLE_ALT = "|".join(re.escape(t) for t in DECISION_MAKER_TITLES)
+# Any title as a substring, in one search
+_TITLE_ANY_RE = re.compile(_TITLE_ALT, re.IGNORECASE)
+_PERSON = r'[A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+'
+
+# Owner patterns for search-result text, compiled once (tried in order)
+_OWNER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        # "John Smith, Owner"
+        rf'({_PERSON})\s*[,\-–—|/]\s*({_TITLE_ALT})',
+        # "Owner: John Smith"
+        rf'({_TITLE_ALT})\s*[:\-–—|/]\s*({_PERSON})',
+        # "owned by John Smith"
+        rf'(?:owned|founded|started)\s+by\s+({_PERSON})',
+    )
+]
+_CAPITALIZED_RE = re.compile(r'[A-Z][a-z]+')
+
+# "4.5 (123 reviews)" / "4.5 · 1,024 ratings"
+RATING_RE = re.compile(
+    r'(\d\.\d)\s*(?:\(|·)\s*(\d[\d,]*)\s*(?:reviews?|ratings?)', re.IGNORECASE
+)
+
 
 class GoogleIntelEnricher(BaseEnricher):
     """Single comprehensive Google search to extract multiple data points.
@@ -228,7 +235,7 @@ class GoogleIntelEnricher(BaseEnricher):
             local = email.split("@")[0]
 
             # Catch exact matches + any google.* country domain
-            if domain in JUNK_EMAIL_DOMAINS or domain.startswith("google.") or ".google." in domain:
+            if is_junk_email_domain(domain):
                 continue
             if len(email) > 50:
                 continue
@@ -251,26 +258,14 @@ class GoogleIntelEnricher(BaseEnricher):
 
     def _extract_owner(self, text: str) -> dict | None:
         """Extract owner/founder name from search results text."""
-        title_pattern = "|".join(re.escape(t) for t in DECISION_MAKER_TITLES)
-        patterns = [
-            # "John Smith, Owner"
-            rf'([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)\s*[,\-–—|/]\s*({title_pattern})',
-            # "Owner: John Smith"
-            rf'({title_pattern})\s*[:\-–—|/]\s*([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-            # "owned by John Smith"
-            rf'(?:owned|founded|started)\s+by\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _OWNER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 2:
                     g1, g2 = groups
                     # Figure out which is name vs title
-                    if re.match(r'[A-Z][a-z]+', g1) and not any(
-                        t in g1.lower() for t in DECISION_MAKER_TITLES
-                    ):
+                    if _CAPITALIZED_RE.match(g1) and not _TITLE_ANY_RE.search(g1):
                         name, title = g1.strip(), g2.strip().title()
                     else:
                         name, title = g2.strip(), g1.strip().title()
@@ -288,8 +283,7 @@ class GoogleIntelEnricher(BaseEnricher):
 
     def _extract_rating(self, text: str) -> dict | None:
         """Extract Google rating and review count from search results."""
-        rating_pattern = r'(\d\.\d)\s*(?:\(|·)\s*(\d[\d,]*)\s*(?:reviews?|ratings?)'
-        match = re.search(rating_pattern, text, re.IGNORECASE)
+        match = RATING_RE.search(text)
         if match:
             try:
                 return {
@@ -307,14 +301,7 @@ class GoogleIntelEnricher(BaseEnricher):
 
         try:
             soup = self.http.get_soup(url, use_cache=False)
-            for a in soup.select("a[href]"):
-                href = a.get("href", "")
-                if "linkedin.com/in/" in href:
-                    if href.startswith("/url?q="):
-                        href = href.split("/url?q=")[1].split("&")[0]
-                    parsed = urlparse(href)
-                    if "/in/" in parsed.path:
-                        return f"https://www.linkedin.com{parsed.path}".rstrip("/")
+            return find_linkedin_profile(soup)
         except Exception:
             pass
 
@@ -6,7 +6,7 @@ import logging
 import re
 from urllib.parse import quote_plus
 
-from src.enrichment.base import BaseEnricher
+from src.enrichment.base import BaseEnricher, iter_jsonld, page_text
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
@@ -55,13 +55,11 @@ class PhoneDiscoveryEnricher(BaseEnricher):
         url = f"https://www.google.com/search?q={quote_plus(query)}"
 
         try:
-            soup = self.http.get_soup(url)
+            text = self.http.get_text(url)
         except Exception as e:
             logger.debug(f"[PhoneDiscovery] Google search failed: {e}")
             return None
 
-        text = soup.get_text(separator=" ")
-
         # Extract all phone numbers
         matches = PHONE_RE.findall(text)
         for area, prefix, line in matches:
@@ -94,18 +92,16 @@ class PhoneDiscoveryEnricher(BaseEnricher):
                 return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
 
         # Check JSON-LD
-        import json
-        for script in soup.select('script[type="application/ld+json"]'):
+        for data in iter_jsonld(soup):
             try:
-                data = json.loads(script.string)
                 phone = self._phone_from_jsonld(data)
-                if phone:
-                    return phone
-            except (json.JSONDecodeError, TypeError):
+            except TypeError:
                 continue
+            if phone:
+                return phone
 
         # Check page text for phone numbers
-        text = soup.get_text(separator=" ")
+        text = page_text(soup)
         matches = PHONE_RE.findall(text)
         if matches:
             area, prefix, line = matches[0]
@@ -21,7 +21,7 @@ from src.enrichment.reviews import ReviewsEnricher
 from src.enrichment.email_verification import EmailVerificationEnricher
 from src.enrichment.icp_scoring import ICPScoringEnricher
 from src.utils.cleaning import calculate_quality_score
-from src.database.models import to_snake_dict, to_prisma_data
+from src.database.field_map import to_snake_dict, to_prisma_data
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
@@ -65,6 +65,9 @@ PHASE_3_MODULES = ["email_verification"]
 # Phase 4: ICP scoring (needs all data)
 PHASE_4_MODULES = ["icp_scoring"]
 
+# Leads enriched at once when the caller doesn't say (config: enrichment.concurrency)
+DEFAULT_CONCURRENCY = 5
+
 
 class EnrichmentPipeline:
     """Run enrichment modules on leads and update the database.
@@ -73,19 +76,23 @@ class EnrichmentPipeline:
     - Shared HTTP client across all modules (URL cache eliminates ~60% of requests)
     - Per-domain rate limiting (requests to different domains don't wait)
     - Independent modules run concurrently via thread pool
-    - Multiple leads processed in parallel via asyncio.gather
+    - A pool of `concurrency` workers pulls leads from a queue, so a slow
+      lead never holds up the others
     """
 
-    def __init__(self, enabled_modules: list[str] = None):
+    def __init__(self, enabled_modules: list[str] = None, concurrency: int = DEFAULT_CONCURRENCY):
         if enabled_modules is None:
             enabled_modules = list(MODULE_MAP.keys())
+        self.concurrency = max(1, int(concurrency))
 
         # Shared HTTP client — all modules share one so URL cache works
         self._shared_http = ScraperHttpClient()
 
-        # Thread pool for running sync enricher modules concurrently
+        # Thread pool for running sync enricher modules concurrently;
+        # sized so every worker can fan out its phase-2 modules
         self._thread_pool = ThreadPoolExecutor(
-            max_workers=6, thread_name_prefix="enricher"
+            max_workers=max(6, min(32, self.concurrency * 4)),
+            thread_name_prefix="enricher",
         )
 
         # Build enricher instances, injecting shared HTTP client
@@ -113,12 +120,10 @@ class EnrichmentPipeline:
         enricher = self._get_enricher(name)
         if not enricher:
             return {}
-        try:
-            result = enricher.safe_enrich(lead)
-            return result or {}
-        except Exception as e:
-            errors.append(f"{name}: {str(e)}")
-            return {}
+        result = enricher.run(lead)
+        if result.error:
+            errors.append(f"{name}: {result.error}")
+        return result.data
 
     def _apply_updates(self, lead, updates: dict):
         """Apply accumulated updates to the lead object so subsequent modules see them."""
@@ -158,9 +163,16 @@ class EnrichmentPipeline:
         updates = {}
         loop = asyncio.get_event_loop()
 
+        # Sequential phases still run in the thread pool so other leads'
+        # workers keep going while this one waits on the network
+        def run_module(mod_name):
+            return loop.run_in_executor(
+                self._thread_pool, self._run_module, mod_name, lead, errors
+            )
+
         # ── Phase 1: Website discovery + Google Intel (sequential) ──
         for mod_name in PHASE_1_MODULES:
-            result = self._run_module(mod_name, lead, errors)
+            result = await run_module(mod_name)
             if result:
                 updates.update(result)
             self._apply_updates(lead, updates)
@@ -179,7 +191,7 @@ class EnrichmentPipeline:
             enricher = self._get_enricher(mod_name)
             if enricher:
                 parallel_tasks.append(
-                    loop.run_in_executor(self._thread_pool, enricher.safe_enrich, lead)
+                    loop.run_in_executor(self._thread_pool, enricher.run, lead)
                 )
                 parallel_names.append(mod_name)
 
@@ -188,21 +200,24 @@ class EnrichmentPipeline:
             for mod_name, result in zip(parallel_names, results):
                 if isinstance(result, Exception):
                     errors.append(f"{mod_name}: {str(result)}")
-                elif isinstance(result, dict) and result:
-                    updates.update(result)
+                    continue
+                if result.error:
+                    errors.append(f"{mod_name}: {result.error}")
+                if result.data:
+                    updates.update(result.data)
 
         self._apply_updates(lead, updates)
 
         # ── Phase 3: Email verification (sequential, needs emails) ──
         for mod_name in PHASE_3_MODULES:
-            result = self._run_module(mod_name, lead, errors)
+            result = await run_module(mod_name)
             if result:
                 updates.update(result)
         self._apply_updates(lead, updates)
 
         # ── Phase 4: ICP scoring (sequential, needs everything) ──
         for mod_name in PHASE_4_MODULES:
-            result = self._run_module(mod_name, lead, errors)
+            result = await run_module(mod_name)
             if result:
                 updates.update(result)
 
@@ -247,45 +262,51 @@ class EnrichmentPipeline:
             return False
 
     async def enrich_batch(self, leads, db: Prisma) -> dict:
-        """Enrich a batch of leads concurrently.
+        """Enrich a batch of leads with a pool of concurrent workers.
 
-        Processes leads in parallel batches of 5 for ~5x speedup.
-        Combined with HTTP caching and parallel modules, total enrichment
-        is ~6-8x faster than the original sequential approach.
+        `concurrency` workers drain a shared queue of leads, so each starts its
+        next lead as soon as it finishes one instead of waiting for the
+        slowest lead of a fixed batch. Per-domain rate limiting in the shared
+        HTTP client still throttles requests to the same host.
         """
         total = len(leads)
-        success = 0
-        failed = 0
-        batch_size = 5  # Concurrent leads
-
-        for i in range(0, total, batch_size):
-            batch = leads[i:i + batch_size]
-
-            # Clear HTTP cache between batches to free memory
-            # (different leads have different websites, cache won't help across leads)
-            self._shared_http.clear_cache()
-
-            # Process batch concurrently
-            tasks = [self._safe_enrich_lead(lead, db) for lead in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception) or result is False:
-                    failed += 1
-                else:
-                    success += 1
-
-            completed = min(i + batch_size, total)
-            logger.info(f"Enrichment progress: {completed}/{total}")
+        counts = {"success": 0, "failed": 0}
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for lead in leads:
+            queue.put_nowait(lead)
+
+        async def worker():
+            while True:
+                try:
+                    lead = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                ok = await self._safe_enrich_lead(lead, db)
+                counts["success" if ok else "failed"] += 1
+                completed = counts["success"] + counts["failed"]
+                if completed % self.concurrency == 0 or completed == total:
+                    logger.info(f"Enrichment progress: {completed}/{total}")
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, total))))
 
         return {
             "total": total,
-            "success": success,
-            "failed": failed,
+            "success": counts["success"],
+            "failed": counts["failed"],
         }
 
     def close(self):
         """Clean up resources."""
+        # Enrichers may own resources of their own (deep_contact's page-fetch
+        # pool); closing their injected shared client again is a no-op
+        for enricher in self.enrichers:
+            close = getattr(enricher, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"[{enricher.MODULE_NAME}] close failed: {e}")
         self._shared_http.close()
         self._thread_pool.shutdown(wait=False)
 
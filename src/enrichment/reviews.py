@@ -4,16 +4,18 @@ from __future__ import annotations
 
 import logging
 import re
-import json
 from urllib.parse import quote_plus
 
 from bs4 import BeautifulSoup
 
-from src.enrichment.base import BaseEnricher
+from src.enrichment.base import BaseEnricher, iter_jsonld
+from src.enrichment.google_intel import RATING_RE
 from src.scrapers.http_client import ScraperHttpClient
 
 logger = logging.getLogger(__name__)
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
 
 class ReviewsEnricher(BaseEnricher):
     """Enrich leads with Google and Yelp review data."""
@@ -62,8 +64,7 @@ class ReviewsEnricher(BaseEnricher):
         # Google shows ratings like "4.5 (123 reviews)"
         page_text = soup.get_text()
 
-        rating_pattern = r'(\d\.\d)\s*(?:\(|·)\s*(\d[\d,]*)\s*(?:reviews?|ratings?)'
-        match = re.search(rating_pattern, page_text, re.IGNORECASE)
+        match = RATING_RE.search(page_text)
         if match:
             try:
                 result["google_rating"] = float(match.group(1))
@@ -94,10 +95,8 @@ class ReviewsEnricher(BaseEnricher):
         result = {}
 
         # Try JSON-LD data first
-        scripts = soup.select('script[type="application/ld+json"]')
-        for script in scripts:
+        for data in iter_jsonld(soup):
             try:
-                data = json.loads(script.string)
                 if isinstance(data, dict) and data.get("@type") == "ItemList":
                     items = data.get("itemListElement", [])
                     for item in items:
@@ -113,15 +112,15 @@ class ReviewsEnricher(BaseEnricher):
                                     rating_data.get("reviewCount", 0)
                                 ) or None
                             return result
-            except (json.JSONDecodeError, AttributeError, TypeError):
+            except (AttributeError, TypeError):
                 continue
 
         return result
 
     def _names_match(self, name1: str, name2: str) -> bool:
         """Fuzzy match two business names."""
-        n1 = re.sub(r"[^a-z0-9]", "", name1.lower())
-        n2 = re.sub(r"[^a-z0-9]", "", name2.lower())
+        n1 = _NON_ALNUM_RE.sub("", name1.lower())
+        n2 = _NON_ALNUM_RE.sub("", name2.lower())
         return n1 == n2 or n1 in n2 or n2 in n1
 
     def close(self):
@@ -42,6 +42,12 @@ EXCLUDED_PATHS = {
     "tiktok_url": ["login"],
 }
 
+# One case-insensitive alternation per field instead of a substring scan per path
+_EXCLUDED_RE = {
+    field: re.compile("|".join(map(re.escape, paths)), re.IGNORECASE)
+    for field, paths in EXCLUDED_PATHS.items()
+}
+
 
 class SocialMediaEnricher(BaseEnricher):
     """Find social media profiles from a business website."""
@@ -83,9 +89,8 @@ class SocialMediaEnricher(BaseEnricher):
 
     def _is_excluded(self, field: str, url: str) -> bool:
         """Check if the URL is a generic/login page, not a business profile."""
-        excluded = EXCLUDED_PATHS.get(field, [])
-        url_lower = url.lower()
-        return any(excl in url_lower for excl in excluded)
+        excluded = _EXCLUDED_RE.get(field)
+        return bool(excluded and excluded.search(url))
 
     def close(self):
         self.http.close()
@@ -28,6 +28,10 @@ EXCLUDED_DOMAINS = {
     "reddit.com",
 }
 
+URL_RE = re.compile(r'https?://[a-zA-Z0-9._-]+\.[a-zA-Z]{2,}(?:/[^\s"<>]*)?')
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_ENTITY_SUFFIX_RE = re.compile(r"(llc|inc|corp|co|ltd|company)$")
+
 
 class WebsiteDiscoveryEnricher(BaseEnricher):
     """Find a business website via Google search when one isn't known."""
@@ -105,11 +109,8 @@ class WebsiteDiscoveryEnricher(BaseEnricher):
                 candidates.append(f"https://{text.split(' ')[0]}")
 
         # Method 3: Regex for URLs in page text
-        url_pattern = re.compile(
-            r'https?://[a-zA-Z0-9._-]+\.[a-zA-Z]{2,}(?:/[^\s"<>]*)?'
-        )
         page_text = soup.get_text()
-        for match in url_pattern.findall(page_text):
+        for match in URL_RE.findall(page_text):
             candidates.append(match)
 
         # Filter and rank candidates
@@ -135,8 +136,8 @@ class WebsiteDiscoveryEnricher(BaseEnricher):
     def _guess_url(self, business_name: str) -> str | None:
         """Try common domain patterns for the business name."""
         # Clean name: "Joe's Plumbing LLC" -> "joesplumbing"
-        clean = re.sub(r"[^a-z0-9]", "", business_name.lower())
-        clean = re.sub(r"(llc|inc|corp|co|ltd|company)$", "", clean)
+        clean = _NON_ALNUM_RE.sub("", business_name.lower())
+        clean = _ENTITY_SUFFIX_RE.sub("", clean)
 
         if len(clean) < 3:
             return None
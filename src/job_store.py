@@ -0,0 +1,202 @@
+"""Job state storage for the API server — in-memory or Redis-backed.
+
+The in-memory store is the default and works for a single uvicorn worker.
+Set REDIS_URL to share job state across workers and keep it across restarts.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Output buffers keep only the most recent lines so long jobs stay bounded
+OUTPUT_MAX_LINES = 500
+
+# Safety TTL for expiring jobs that never finish (e.g. a worker died mid-run);
+# refreshed by every output line, so it only lapses once a job goes silent
+RUNNING_TTL_SECONDS = 24 * 3600
+
+
+class MemoryJobStore:
+    """Process-local job store."""
+
+    def __init__(self):
+        self._jobs: dict[str, dict] = {}
+        # Min-heap of (expiry_ts, job_id) — only expiring jobs are pushed
+        self._expiry: list[tuple[float, str]] = []
+
+    def _clean_old_jobs(self):
+        # Pop only the jobs whose expiry has passed instead of scanning them all.
+        # Jobs still running at expiry are pushed back and checked again later.
+        now = time.time()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, jid = heapq.heappop(self._expiry)
+            job = self._jobs.get(jid)
+            if job is None:
+                continue
+            if job["status"] == "running":
+                heapq.heappush(self._expiry, (now + 60, jid))
+            else:
+                del self._jobs[jid]
+
+    async def create(self, job_id: str, fields: dict, ttl: int | None = None):
+        """Create (or reset) a job. Jobs with a ttl expire that long after creation."""
+        self._clean_old_jobs()
+        self._jobs[job_id] = {**fields, "output": deque(maxlen=OUTPUT_MAX_LINES)}
+        if ttl:
+            heapq.heappush(self._expiry, (time.time() + ttl, job_id))
+
+    async def claim(self, job_id: str, fields: dict, ttl: int | None = None) -> bool:
+        """Create the job unless one with this id is still running."""
+        job = self._jobs.get(job_id)
+        if job is not None and job["status"] == "running":
+            return False
+        await self.create(job_id, fields, ttl)
+        return True
+
+    async def update(self, job_id: str, **fields):
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+    async def append_output(self, job_id: str, line: str):
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job["output"].append(line)
+
+    async def get(self, job_id: str) -> dict | None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {**job, "output": list(job["output"])}
+
+    async def list_jobs(self, prefix: str) -> list[dict]:
+        """Return jobs whose id starts with prefix, with an output line count."""
+        return [
+            {**{k: v for k, v in job.items() if k != "output"},
+             "job_id": jid, "output_lines": len(job["output"])}
+            for jid, job in self._jobs.items()
+            if jid.startswith(prefix)
+        ]
+
+    async def close(self):
+        pass
+
+
+class RedisJobStore:
+    """Redis-backed job store: one hash per job plus a capped output list."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self.r = redis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    async def create(self, job_id: str, fields: dict, ttl: int | None = None):
+        """Create (or reset) a job; ttl applies once it finishes (None keeps it).
+
+        While running, the hash and output list carry RUNNING_TTL_SECONDS so a
+        job whose worker died expires instead of reading "running" forever.
+        """
+        key = self._key(job_id)
+        mapping = {k: json.dumps(v) for k, v in fields.items()}
+        mapping["_ttl"] = json.dumps(ttl)
+        async with self.r.pipeline(transaction=True) as pipe:
+            pipe.delete(key, f"{key}:out")
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, RUNNING_TTL_SECONDS)
+            if ttl:
+                pipe.zadd("jobs", {job_id: time.time()})
+            await pipe.execute()
+
+    async def claim(self, job_id: str, fields: dict, ttl: int | None = None) -> bool:
+        """Create the job unless one with this id is still running.
+
+        The check is a SET NX on a lock key, so only one worker can win it;
+        the lock expires with the running job and is dropped when it finishes.
+        """
+        lock = f"{self._key(job_id)}:lock"
+        if not await self.r.set(lock, "1", nx=True, ex=RUNNING_TTL_SECONDS):
+            return False
+        await self.create(job_id, fields, ttl)
+        return True
+
+    async def update(self, job_id: str, **fields):
+        key = self._key(job_id)
+        await self.r.hset(key, mapping={k: json.dumps(v) for k, v in fields.items()})
+        # Finished jobs get their real TTL (or none); running ones keep the safety TTL
+        if fields.get("status", "running") != "running":
+            ttl = json.loads(await self.r.hget(key, "_ttl") or "null")
+            async with self.r.pipeline(transaction=False) as pipe:
+                if ttl:
+                    pipe.expire(key, ttl)
+                    pipe.expire(f"{key}:out", ttl)
+                else:
+                    pipe.persist(key)
+                    pipe.persist(f"{key}:out")
+                pipe.delete(f"{key}:lock")
+                await pipe.execute()
+
+    async def append_output(self, job_id: str, line: str):
+        key = self._key(job_id)
+        async with self.r.pipeline(transaction=False) as pipe:
+            pipe.rpush(f"{key}:out", line)
+            pipe.ltrim(f"{key}:out", -OUTPUT_MAX_LINES, -1)
+            # Heartbeat: a job that is still writing output is still alive
+            pipe.expire(f"{key}:out", RUNNING_TTL_SECONDS)
+            pipe.expire(key, RUNNING_TTL_SECONDS)
+            pipe.expire(f"{key}:lock", RUNNING_TTL_SECONDS)
+            await pipe.execute()
+
+    @staticmethod
+    def _decode(raw: dict) -> dict:
+        return {k: json.loads(v) for k, v in raw.items() if k != "_ttl"}
+
+    async def get(self, job_id: str) -> dict | None:
+        key = self._key(job_id)
+        async with self.r.pipeline(transaction=False) as pipe:
+            pipe.hgetall(key)
+            pipe.lrange(f"{key}:out", 0, -1)
+            raw, output = await pipe.execute()
+        if not raw:
+            return None
+        return {**self._decode(raw), "output": output}
+
+    async def list_jobs(self, prefix: str) -> list[dict]:
+        job_ids = [jid for jid in await self.r.zrange("jobs", 0, -1) if jid.startswith(prefix)]
+        if not job_ids:
+            return []
+        async with self.r.pipeline(transaction=False) as pipe:
+            for jid in job_ids:
+                pipe.hgetall(self._key(jid))
+                pipe.llen(f"{self._key(jid)}:out")
+            results = await pipe.execute()
+
+        jobs, expired = [], []
+        for jid, raw, lines in zip(job_ids, results[::2], results[1::2]):
+            if not raw:
+                expired.append(jid)
+                continue
+            jobs.append({**self._decode(raw), "job_id": jid, "output_lines": lines})
+        if expired:
+            await self.r.zrem("jobs", *expired)
+        return jobs
+
+    async def close(self):
+        await self.r.aclose()
+
+
+def create_job_store(redis_url: str | None = None):
+    """Redis store when a URL is configured, otherwise in-memory."""
+    if redis_url:
+        logger.info("Using Redis job store")
+        return RedisJobStore(redis_url)
+    return MemoryJobStore()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 
 from src.scrapers.http_client import ScraperHttpClient
 from src.utils.cleaning import clean_lead_data
@@ -16,35 +18,56 @@ class BaseScraper(ABC):
 
     SOURCE_NAME = "base"
 
-    def __init__(self):
-        self.http = ScraperHttpClient()
+    def __init__(self, http: ScraperHttpClient | None = None):
+        # A caller-supplied client is shared with other scrapers and stays
+        # open when this scraper closes; otherwise we own a private one.
+        self._owns_http = http is None
+        self.http = http or ScraperHttpClient()
 
     @abstractmethod
-    def search(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
+    def search(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
         """
         Search for businesses in a category and location.
-        Returns a list of raw lead dicts.
+        Yields raw lead dicts as each results page is parsed.
         """
         pass
 
-    def scrape(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
-        """Search and clean results."""
+    def iter_scrape(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
+        """Search and clean results, yielding each lead as soon as it is parsed."""
         logger.info(f"[{self.SOURCE_NAME}] Scraping '{category}' in '{location}'")
-        raw_leads = self.search(category, location, max_pages)
-        cleaned = []
-        for lead in raw_leads:
+        raw = cleaned = 0
+        for lead in self.search(category, location, max_pages):
+            raw += 1
             lead["source"] = self.SOURCE_NAME
             lead["country"] = "US"
             cleaned_lead = clean_lead_data(lead)
             if cleaned_lead:
-                cleaned.append(cleaned_lead)
-        logger.info(
-            f"[{self.SOURCE_NAME}] Found {len(raw_leads)} raw, {len(cleaned)} cleaned"
-        )
-        return cleaned
+                cleaned += 1
+                yield cleaned_lead
+        logger.info(f"[{self.SOURCE_NAME}] Found {raw} raw, {cleaned} cleaned")
+
+    def scrape(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
+        """Search and clean results."""
+        return list(self.iter_scrape(category, location, max_pages))
+
+    async def scrape_stream(
+        self, category: str, location: str, max_pages: int = 5
+    ) -> AsyncIterator[dict]:
+        """Async view of iter_scrape for the engine.
+
+        The blocking HTTP/parse work runs in a worker thread, so the event
+        loop keeps writing earlier leads while the next page is fetched.
+        """
+        leads = self.iter_scrape(category, location, max_pages)
+        while True:
+            lead = await asyncio.to_thread(next, leads, None)
+            if lead is None:
+                return
+            yield lead
 
     def close(self):
-        self.http.close()
+        if self._owns_http:
+            self.http.close()
 
     def __enter__(self):
         return self
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 import re
 import json
 from urllib.parse import quote_plus
@@ -20,19 +21,17 @@ class BBBScraper(BaseScraper):
     SOURCE_NAME = "bbb"
     BASE_URL = "https://www.bbb.org"
 
-    def search(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
-        leads = []
+    def search(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
         for page in range(1, max_pages + 1):
             try:
                 page_leads = self._scrape_page(category, location, page)
                 if not page_leads:
                     break
-                leads.extend(page_leads)
+                yield from page_leads
                 logger.debug(f"[BBB] Page {page}: {len(page_leads)} listings")
             except Exception as e:
                 logger.error(f"[BBB] Error on page {page}: {e}")
                 break
-        return leads
 
     def _scrape_page(self, category: str, location: str, page: int) -> list[dict]:
         """Scrape a single BBB search results page using Playwright."""
@@ -6,6 +6,7 @@ import json
 import logging
 import re
 import time
+from collections.abc import Iterator
 from urllib.parse import quote_plus, unquote
 
 from src.scrapers.base import BaseScraper
@@ -19,10 +20,11 @@ class GoogleMapsScraper(BaseScraper):
     SOURCE_NAME = "googlemaps"
     BASE_URL = "https://www.google.com/maps/search"
 
-    def search(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
+    def search(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
         """
         Search Google Maps for businesses and scrape each detail page.
         max_pages controls how many scroll batches to load (each ~7-10 results).
+        Leads are yielded as each detail page is parsed.
         """
         query = f"{category} in {location}"
         url = f"{self.BASE_URL}/{quote_plus(query)}"
@@ -33,24 +35,23 @@ class GoogleMapsScraper(BaseScraper):
             listing_urls = self._collect_listing_urls(url, scroll_count=max_pages)
             logger.info(f"[GoogleMaps] Found {len(listing_urls)} listing URLs")
 
-            leads = []
+            extracted = 0
             for i, listing_url in enumerate(listing_urls):
                 try:
                     lead = self._scrape_detail_page(listing_url, category)
                     if lead:
-                        leads.append(lead)
+                        extracted += 1
                         logger.debug(f"[GoogleMaps] [{i+1}/{len(listing_urls)}] {lead['business_name']}")
+                        yield lead
                     else:
                         logger.debug(f"[GoogleMaps] [{i+1}/{len(listing_urls)}] Skipped (closed/invalid)")
                 except Exception as e:
                     logger.debug(f"[GoogleMaps] Detail page error: {e}")
                     continue
 
-            logger.info(f"[GoogleMaps] Extracted {len(leads)} leads from detail pages")
-            return leads
+            logger.info(f"[GoogleMaps] Extracted {extracted} leads from detail pages")
         except Exception as e:
             logger.error(f"[GoogleMaps] Search failed: {e}")
-            return []
 
     # ──────────────────────────────────────────────────────────────────────
     # Step 1: Scroll search results to collect listing URLs
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import re
 import time
 import random
 import logging
 import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, Future
-from urllib.parse import urlparse
+from functools import lru_cache
+from html import unescape
+from urllib.parse import urljoin, urlparse
 
 import httpx
 from fake_useragent import UserAgent
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from src.config import REQUEST_TIMEOUT, MAX_RETRIES, PROXY_URL
+from src.config import (
+    REQUEST_TIMEOUT, MAX_RETRIES, PROXY_URL,
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE, HTTP_KEEPALIVE_EXPIRY,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,40 @@ SLOW_DOMAINS = {"google.com", "yelp.com", "bbb.org", "yellowpages.com"}
 SLOW_DELAY = 2.0    # seconds for search engines / directories
 FAST_DELAY = 0.5    # seconds for business websites
 
+# Entries kept per response/soup cache; least recently used are evicted
+CACHE_MAX_ENTRIES = 256
+
+# Script/style blocks, comments, and any remaining tag — stripped to get page text
+_TAG_RE = re.compile(
+    r"<script\b[^>]*>.*?</script\s*>|<style\b[^>]*>.*?</style\s*>|<!--.*?-->|<[^>]+>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def html_to_text(markup: str) -> str:
+    """Visible text of an HTML document, tags replaced by spaces.
+
+    Snippet-grade stand-in for soup.get_text(separator=" "): good enough for
+    regex searches over result pages, with no tree built at all.
+    """
+    return unescape(_TAG_RE.sub(" ", markup))
+
+
+@lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """Cache identity for a URL: lowercase host without www., no trailing slash.
+
+    Leads for the same franchise often list one site as http://Example.com/
+    and https://www.example.com — both should hit the same cached page.
+    """
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path.rstrip("/")
+    query = f"?{parsed.query}" if parsed.query else ""
+    return f"{host}{path}{query}"
+
 
 class ScraperHttpClient:
     """HTTP client configured for web scraping with protections."""
@@ -36,13 +77,39 @@ class ScraperHttpClient:
             timeout=REQUEST_TIMEOUT,
             follow_redirects=True,
             proxy=proxies,
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            # Pooled keep-alive connections, sized for every enrichment worker
+            # sharing this client; a site's homepage and about pages reuse one
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
         )
         self._browser_client: BrowserClient | None = None
-
-        # Response caches — same URL only fetched once per enrichment cycle
-        self._response_cache: dict[str, httpx.Response] = {}
-        self._soup_cache: dict[str, object] = {}  # BeautifulSoup objects
+        self._browser_lock = threading.Lock()
+
+        # Response caches — same URL only fetched once while it stays hot.
+        # Bounded LRUs, so concurrent enrichment workers never need to clear them.
+        self._cache_lock = threading.Lock()
+        self._response_cache: OrderedDict[str, httpx.Response] = OrderedDict()
+        self._soup_cache: OrderedDict[str, object] = OrderedDict()  # BeautifulSoup objects
+        # probe() outcomes, including misses, so a site's paths are checked once
+        self._probe_cache: OrderedDict[str, str | None] = OrderedDict()
+
+    def _cache_get(self, cache: OrderedDict, key: str):
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key: str, value, replace: bool = True):
+        with self._cache_lock:
+            if replace or key not in cache:
+                cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
 
     def _get_headers(self) -> dict:
         """Generate realistic browser headers."""
@@ -90,12 +157,14 @@ class ScraperHttpClient:
     )
     def get(self, url: str, params: dict = None, use_cache: bool = True) -> httpx.Response:
         """Make a GET request with rate limiting, retries, and optional caching."""
-        cache_key = f"{url}|{params}"
+        cache_key = f"{normalize_url(url)}|{params}"
 
         # Check cache first
-        if use_cache and cache_key in self._response_cache:
-            logger.debug(f"CACHE HIT {url}")
-            return self._response_cache[cache_key]
+        if use_cache:
+            cached = self._cache_get(self._response_cache, cache_key)
+            if cached is not None:
+                logger.debug(f"CACHE HIT {url}")
+                return cached
 
         self._rate_limit(url)
         headers = self._get_headers()
@@ -105,34 +174,107 @@ class ScraperHttpClient:
 
         # Store in cache
         if use_cache:
-            self._response_cache[cache_key] = response
+            self._cache_put(self._response_cache, cache_key, response)
 
         return response
 
-    def get_soup(self, url: str, params: dict = None, use_cache: bool = True):
-        """Make a GET request and return a BeautifulSoup object."""
+    def probe(self, url: str) -> str | None:
+        """Cheap existence check: a HEAD request that doesn't follow redirects.
+
+        Returns the URL worth a full GET — the redirect target for a 3xx, or
+        url itself on 2xx — and None when the page is missing (other 4xx).
+        Anything inconclusive (network error, 403/429 from a WAF, 5xx, HEAD
+        not supported) returns url uncached, so the GET decides.
+
+        The HEAD itself isn't rate limited, since a GET usually follows and
+        takes the slot; a miss is charged to the domain afterwards instead.
+        """
+        key = normalize_url(url)
+        with self._cache_lock:
+            if key in self._probe_cache:
+                self._probe_cache.move_to_end(key)
+                return self._probe_cache[key]
+
+        try:
+            response = self.client.head(url, headers=self._get_headers(), follow_redirects=False)
+        except httpx.HTTPError as e:
+            logger.debug(f"HEAD {url} failed: {e}")
+            return url
+
+        status = response.status_code
+        if response.is_redirect:
+            target = urljoin(url, response.headers.get("location", ""))
+        elif response.is_success:
+            target = url
+        elif status in (403, 405, 429, 501) or status >= 500:
+            return url
+        else:
+            target = None
+            self._charge_rate_limit(url)
+
+        self._cache_put(self._probe_cache, key, target)
+        return target
+
+    def _charge_rate_limit(self, url: str):
+        """Count a request against the domain's delay without waiting for it."""
+        domain = urlparse(url).netloc.lower()
+        with self._lock:
+            last = self._domain_last_request.get(domain, 0)
+            self._domain_last_request[domain] = max(last, time.time())
+
+    def get_soup(self, url: str, params: dict = None, use_cache: bool = True, parse_only=None):
+        """Make a GET request and return a BeautifulSoup object.
+
+        parse_only takes a bs4 SoupStrainer to build only part of the tree
+        (e.g. just <a> tags); partial soups are cached separately from full ones.
+        """
         from bs4 import BeautifulSoup
 
-        cache_key = f"{url}|{params}"
+        # Strainers are module-level constants, so their id is a stable key
+        suffix = f"|{id(parse_only)}" if parse_only is not None else ""
+        cache_key = f"{normalize_url(url)}|{params}{suffix}"
 
         # Check soup cache first
-        if use_cache and cache_key in self._soup_cache:
-            logger.debug(f"SOUP CACHE HIT {url}")
-            return self._soup_cache[cache_key]
+        if use_cache:
+            cached = self._cache_get(self._soup_cache, cache_key)
+            if cached is not None:
+                logger.debug(f"SOUP CACHE HIT {url}")
+                return cached
 
         response = self.get(url, params=params, use_cache=use_cache)
-        soup = BeautifulSoup(response.text, "lxml")
+
+        # Different URLs that redirect to the same page (e.g. /about -> /)
+        # share one parse, keyed by the final URL
+        final_key = f"{normalize_url(str(response.url))}|None{suffix}"
+        soup = self._cache_get(self._soup_cache, final_key) if use_cache else None
+        if soup is None:
+            soup = BeautifulSoup(response.text, "lxml", parse_only=parse_only)
+            if parse_only is None:
+                # Lets page_text() strip the markup in C instead of walking the tree
+                soup.__dict__["_markup"] = response.text
 
         # Store in soup cache
         if use_cache:
-            self._soup_cache[cache_key] = soup
+            self._cache_put(self._soup_cache, cache_key, soup)
+            self._cache_put(self._soup_cache, final_key, soup, replace=False)
 
         return soup
 
+    def get_text(self, url: str, params: dict = None, use_cache: bool = True) -> str:
+        """Fetch a page and return its visible text, joined with spaces.
+
+        For pages that are only grepped (search results) — a regex strip of
+        the markup instead of building a BeautifulSoup tree.
+        """
+        response = self.get(url, params=params, use_cache=use_cache)
+        return html_to_text(response.text)
+
     def clear_cache(self):
-        """Clear all response caches. Call between leads to free memory."""
-        self._response_cache.clear()
-        self._soup_cache.clear()
+        """Clear all response caches."""
+        with self._cache_lock:
+            self._response_cache.clear()
+            self._soup_cache.clear()
+            self._probe_cache.clear()
 
     def get_rendered_soup(self, url: str, params: dict = None, wait_selector: str = None, wait_ms: int = 3000):
         """
@@ -158,9 +300,11 @@ class ScraperHttpClient:
             separator = "&" if "?" in url else "?"
             url = f"{url}{separator}{urlencode(params)}"
 
-        # Lazy-init the browser client
+        # Lazy-init the browser client (scrapes may run on several threads)
         if self._browser_client is None:
-            self._browser_client = BrowserClient()
+            with self._browser_lock:
+                if self._browser_client is None:
+                    self._browser_client = BrowserClient()
 
         logger.debug(f"GET (Playwright) {url}")
         html = self._browser_client.fetch(url, wait_selector=wait_selector, wait_ms=wait_ms)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from src.scrapers.base import BaseScraper
+from src.scrapers.http_client import ScraperHttpClient
 from src.scrapers.yellowpages import YellowPagesScraper
 from src.scrapers.bbb import BBBScraper
 from src.scrapers.yelp import YelpScraper
@@ -16,13 +17,13 @@ SCRAPERS: dict[str, type[BaseScraper]] = {
 }
 
 
-def get_scraper(source_name: str) -> BaseScraper:
-    """Get a scraper instance by source name."""
+def get_scraper(source_name: str, http: ScraperHttpClient | None = None) -> BaseScraper:
+    """Get a scraper instance by source name, optionally on a shared HTTP client."""
     scraper_cls = SCRAPERS.get(source_name.lower())
     if not scraper_cls:
         available = ", ".join(SCRAPERS.keys())
         raise ValueError(f"Unknown source '{source_name}'. Available: {available}")
-    return scraper_cls()
+    return scraper_cls(http=http)
 
 
 def get_all_scrapers() -> list[BaseScraper]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 import re
 from urllib.parse import quote_plus
 
@@ -19,21 +20,19 @@ class YellowPagesScraper(BaseScraper):
     SOURCE_NAME = "yellowpages"
     BASE_URL = "https://www.yellowpages.com"
 
-    def search(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
-        leads = []
+    def search(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
         for page in range(1, max_pages + 1):
             try:
                 page_leads = self._scrape_page(category, location, page)
                 if not page_leads:
                     break
-                leads.extend(page_leads)
+                yield from page_leads
                 logger.debug(
                     f"[YellowPages] Page {page}: {len(page_leads)} listings"
                 )
             except Exception as e:
                 logger.error(f"[YellowPages] Error on page {page}: {e}")
                 break
-        return leads
 
     def _scrape_page(self, category: str, location: str, page: int) -> list[dict]:
         """Scrape a single results page using Playwright for JS rendering."""
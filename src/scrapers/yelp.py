@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 import re
 import json
 
@@ -19,22 +20,20 @@ class YelpScraper(BaseScraper):
     SOURCE_NAME = "yelp"
     BASE_URL = "https://www.yelp.com"
 
-    def search(self, category: str, location: str, max_pages: int = 5) -> list[dict]:
-        leads = []
+    def search(self, category: str, location: str, max_pages: int = 5) -> Iterator[dict]:
         for page in range(max_pages):
             try:
                 start = page * 10
                 page_leads = self._scrape_page(category, location, start)
                 if not page_leads:
                     break
-                leads.extend(page_leads)
+                yield from page_leads
                 logger.debug(
                     f"[Yelp] Page {page + 1}: {len(page_leads)} listings"
                 )
             except Exception as e:
                 logger.error(f"[Yelp] Error on page {page + 1}: {e}")
                 break
-        return leads
 
     def _scrape_page(self, category: str, location: str, start: int) -> list[dict]:
         """Scrape a single Yelp search results page using Playwright."""
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import csv
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-
 from src.database.connection import get_client, disconnect
-from src.database.models import to_snake_dict
+from src.database.field_map import to_snake_dict
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched and written per round-trip — bounds memory for large exports
+EXPORT_PAGE_SIZE = 1000
+
+# Internal columns (dedup keys) left out of exported records
+EXPORT_EXCLUDED_FIELDS = ("business_name_norm",)
+
 
 async def export_leads(
     format: str = "csv",
@@ -26,8 +31,13 @@ async def export_leads(
     """
     Export leads to file.
 
-    Returns the output file path.
+    Leads are read and written in pages of EXPORT_PAGE_SIZE, so memory stays
+    flat regardless of how many rows match. Returns the output file path.
     """
+    fmt = format.lower()
+    if fmt not in ("csv", "json"):
+        raise ValueError(f"Unsupported format: {format}. Use 'csv' or 'json'.")
+
     db = await get_client()
 
     # Build where clause
@@ -41,40 +51,81 @@ async def export_leads(
     if enriched_only:
         where["isEnriched"] = True
 
-    leads = await db.lead.find_many(where=where if where else None)
-    await disconnect()
-
-    if not leads:
-        logger.warning("No leads found matching export criteria")
-        return ""
-
-    # Convert to list of snake_case dicts
-    records = []
-    for lead in leads:
-        record = to_snake_dict(lead)
-        # Serialize complex types
-        if record.get("tech_stack") and isinstance(record["tech_stack"], dict):
-            record["tech_stack"] = json.dumps(record["tech_stack"])
-        if record.get("industry_tags") and isinstance(record["industry_tags"], list):
-            record["industry_tags"] = ", ".join(record["industry_tags"])
-        records.append(record)
-
-    # Create output directory
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    if format.lower() == "csv":
-        filepath = output_path / f"leads_{timestamp}.csv"
-        df = pd.DataFrame(records)
-        df.to_csv(filepath, index=False)
-    elif format.lower() == "json":
-        filepath = output_path / f"leads_{timestamp}.json"
-        with open(filepath, "w") as f:
-            json.dump(records, f, indent=2, default=str)
-    else:
-        raise ValueError(f"Unsupported format: {format}. Use 'csv' or 'json'.")
-
-    logger.info(f"Exported {len(records)} leads to {filepath}")
+    try:
+        pages = _iter_record_pages(db, where)
+        try:
+            first_page = await pages.__anext__()
+        except StopAsyncIteration:
+            first_page = None
+        if not first_page:
+            logger.warning("No leads found matching export criteria")
+            return ""
+
+        # Create output directory
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = output_path / f"leads_{timestamp}.{fmt}"
+        count = 0
+
+        with open(filepath, "w", newline="" if fmt == "csv" else None) as f:
+            if fmt == "csv":
+                writer = csv.DictWriter(f, fieldnames=list(first_page[0].keys()))
+                writer.writeheader()
+                writer.writerows(first_page)
+                count += len(first_page)
+                async for page in pages:
+                    writer.writerows(page)
+                    count += len(page)
+            else:
+                # Same layout as json.dump(records, indent=2), written page by page
+                f.write("[")
+                async for page in _chain(first_page, pages):
+                    for record in page:
+                        f.write(",\n  " if count else "\n  ")
+                        f.write(json.dumps(record, indent=2, default=str).replace("\n", "\n  "))
+                        count += 1
+                f.write("\n]")
+    finally:
+        await disconnect()
+
+    logger.info(f"Exported {count} leads to {filepath}")
     return str(filepath)
+
+
+async def _iter_record_pages(db, where: dict):
+    """Yield export-ready records in id order, EXPORT_PAGE_SIZE rows at a time."""
+    cursor = None
+    while True:
+        leads = await db.lead.find_many(
+            where=where if where else None,
+            order={"id": "asc"},
+            take=EXPORT_PAGE_SIZE,
+            **({"cursor": {"id": cursor}, "skip": 1} if cursor is not None else {}),
+        )
+        if not leads:
+            return
+        yield [_to_record(lead) for lead in leads]
+        if len(leads) < EXPORT_PAGE_SIZE:
+            return
+        cursor = leads[-1].id
+
+
+async def _chain(first: list, rest):
+    yield first
+    async for page in rest:
+        yield page
+
+
+def _to_record(lead) -> dict:
+    """Convert a lead to a flat snake_case dict."""
+    record = to_snake_dict(lead)
+    for field in EXPORT_EXCLUDED_FIELDS:
+        record.pop(field, None)
+    # Serialize complex types
+    if record.get("tech_stack") and isinstance(record["tech_stack"], dict):
+        record["tech_stack"] = json.dumps(record["tech_stack"])
+    if record.get("industry_tags") and isinstance(record["industry_tags"], list):
+        record["industry_tags"] = ", ".join(record["industry_tags"])
+    return record
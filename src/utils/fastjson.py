@@ -0,0 +1,26 @@
+"""JSON helpers backed by orjson when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(value) -> str:
+        """Serialize to a compact JSON string."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    def dumps(value) -> str:
+        """Serialize to a compact JSON string."""
+        return json.dumps(value, separators=(",", ":"))
+
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError